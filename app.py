@@ -10,45 +10,58 @@ class App:
         self.screens = {}
         self.state = MAIN_MENU
         self.history = []
+        self._current = None  # screen for self.state, refreshed on transitions
 
     def register(self, state, screen):
         """Register a screen object for a state."""
         self.screens[state] = screen
+        if state == self.state:
+            self._current = screen
+
+    def _enter(self, state):
+        """Make state the active screen and run its on_enter hook."""
+        self.state = state
+        self._current = self.screens.get(state)
+        if self._current and hasattr(self._current, "on_enter"):
+            self._current.on_enter()
 
     def go_to(self, state):
         """Push current state to history and switch to new state."""
         self.history.append(self.state)
-        self.state = state
-        screen = self.screens.get(state)
-        if screen and hasattr(screen, "on_enter"):
-            screen.on_enter()
+        self._enter(state)
 
     def go_back(self):
         """Pop history and return to previous state."""
         if self.history:
-            self.state = self.history.pop()
-            screen = self.screens.get(self.state)
-            if screen and hasattr(screen, "on_enter"):
-                screen.on_enter()
+            self._enter(self.history.pop())
 
     def handle_event(self, event):
         """Route event to current screen."""
-        screen = self.screens.get(self.state)
-        if screen:
-            screen.handle_event(event)
+        if self._current:
+            self._current.handle_event(event)
+
+    def is_animated(self):
+        """True if the current screen needs frames without input.
+        Screens without an is_animated() hook are assumed animated."""
+        if self._current and hasattr(self._current, "is_animated"):
+            return self._current.is_animated()
+        return True
 
     def update(self, dt):
         """Route update to current screen."""
-        screen = self.screens.get(self.state)
-        if screen:
-            screen.update(dt)
+        if self._current:
+            self._current.update(dt)
 
     def draw(self, surface):
-        """Route draw to current screen."""
-        screen = self.screens.get(self.state)
-        if screen:
-            screen.draw(surface)
+        """Route draw to current screen. Returns the list of rects that changed,
+        or None if the whole surface should be presented."""
+        dirty = None
+        if self._current:
+            dirty = self._current.draw(surface)
         # Status indicators on every screen
         pct, charging = get_battery()
-        draw_battery_indicator(surface, pct, charging)
-        draw_wifi_indicator(surface, get_wifi_connected())
+        batt_rect = draw_battery_indicator(surface, pct, charging)
+        wifi_rect = draw_wifi_indicator(surface, get_wifi_connected())
+        if dirty is None:
+            return None
+        return dirty + [batt_rect, wifi_rect]
@@ -1,6 +1,7 @@
 import pygame
 import random
 import sys
+from spatial import UniformGrid
 
 # --- Configuration ---
 WIDTH, HEIGHT = 720, 720  # HyperPixel 4.0 Square Resolution
@@ -9,6 +10,41 @@ WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
 SKY_BLUE = (135, 206, 235)
 GOLD = (255, 215, 0)
+MAX_RADIUS = 60
+GRID_CELL = 2 * MAX_RADIUS  # Spatial hash cell size
+
+
+def render_bubble(radius, color):
+    """Draw a bubble (body + shine) once onto its own alpha surface."""
+    surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (radius, radius), radius)
+    shine_offset = radius // 3
+    shine_radius = radius // 4
+    pygame.draw.circle(surf, WHITE, (radius - shine_offset, radius - shine_offset), shine_radius)
+    return surf
+
+
+def overlaps(x, y, r, bubbles):
+    """True if a circle at (x, y) with radius r overlaps any of bubbles."""
+    for b in bubbles:
+        dx = x - b.pos[0]
+        dy = y - b.pos[1]
+        rr = r + b.radius
+        if dx * dx + dy * dy < rr * rr:
+            return True
+    return False
+
+
+class Bubble(pygame.sprite.DirtySprite):
+    """A poppable bubble. Static once spawned, so the group only redraws it
+    when something around it changes."""
+    def __init__(self, x, y, radius, color):
+        super().__init__()
+        self.pos = (x, y)
+        self.radius = radius
+        self.image = render_bubble(radius, color)
+        self.rect = self.image.get_rect(center=(x, y))
+
 
 class AvaGameBox:
     def __init__(self):
@@ -17,48 +53,67 @@ class AvaGameBox:
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
         pygame.display.set_caption("Ava's Game Box")
         self.clock = pygame.time.Clock()
+        # Taps and quit are the only events handled; keep everything else off the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN])
         self.font_large = pygame.font.SysFont("Arial", 150, bold=True)
         self.font_small = pygame.font.SysFont("Arial", 50, bold=True)
         
         self.state = "SPLASH"
-        self.bubbles = []
+        self.bubbles = pygame.sprite.LayeredDirty()
+        self.background = pygame.Surface((WIDTH, HEIGHT))
+        self.background.fill(WHITE)
+        self.bubbles.clear(self.screen, self.background)
+        self.grid = UniformGrid(GRID_CELL)  # bubbles keyed by center
+        # Cells with no bubble center in them — spawn candidates
+        self.free_cells = {(gx, gy) for gx in range(WIDTH // GRID_CELL)
+                           for gy in range(HEIGHT // GRID_CELL)}
         self.btn_rect = pygame.Rect(WIDTH // 4, HEIGHT // 2 + 100, WIDTH // 2, 100)
+        # Splash text never changes: render it once
+        self.splash_title = self.font_large.render("AVA", True, WHITE)
+        self.splash_title_rect = self.splash_title.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
+        self.splash_play = self.font_small.render("TAP TO PLAY", True, BLACK)
+        self.splash_play_rect = self.splash_play.get_rect(center=self.btn_rect.center)
 
     def draw_splash(self):
         self.screen.fill(SKY_BLUE)
-
-        text_surf = self.font_large.render("AVA", True, WHITE)
-        text_rect = text_surf.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 50))
-
         pygame.draw.rect(self.screen, GOLD, self.btn_rect, border_radius=20)
-
-        play_surf = self.font_small.render("TAP TO PLAY", True, BLACK)
-        play_rect = play_surf.get_rect(center=self.btn_rect.center)
-
-        self.screen.blit(text_surf, text_rect)
-        self.screen.blit(play_surf, play_rect)
+        self.screen.blit(self.splash_title, self.splash_title_rect)
+        self.screen.blit(self.splash_play, self.splash_play_rect)
 
     def spawn_bubble(self):
-        radius = random.randint(30, 60)
-        for _ in range(50):
-            x = random.randint(radius, WIDTH - radius)
-            y = random.randint(radius, HEIGHT - radius)
-            if not any(((x - b["pos"][0])**2 + (y - b["pos"][1])**2)**0.5 < radius + b["radius"] for b in self.bubbles):
+        radius = random.randint(30, MAX_RADIUS)
+        # Try each empty cell once, in random order, with a jittered center.
+        # Cost depends on the grid size, not on how many bubbles exist.
+        x = random.randint(radius, WIDTH - radius)
+        y = random.randint(radius, HEIGHT - radius)
+        for gx, gy in random.sample(tuple(self.free_cells), len(self.free_cells)):
+            x = random.randint(max(radius, gx * GRID_CELL),
+                               min(WIDTH - radius, (gx + 1) * GRID_CELL - 1))
+            y = random.randint(max(radius, gy * GRID_CELL),
+                               min(HEIGHT - radius, (gy + 1) * GRID_CELL - 1))
+            if not overlaps(x, y, radius, self.grid.query_radius(x, y, radius + MAX_RADIUS)):
                 break
-        bubble = {
-            "pos": [x, y],
-            "radius": radius,
-            "color": (random.randint(100, 255), random.randint(100, 255), random.randint(100, 255))
-        }
-        self.bubbles.append(bubble)
+        color = (random.randint(100, 255), random.randint(100, 255), random.randint(100, 255))
+        bubble = Bubble(x, y, radius, color)
+        self.bubbles.add(bubble)
+        self.free_cells.discard(self.grid.insert(bubble, x, y))
+
+    def pop_bubble_at(self, pos):
+        """Remove the bubble under pos, if any. Returns True if one was popped."""
+        for b in self.grid.query_radius(pos[0], pos[1], MAX_RADIUS):
+            dx = pos[0] - b.pos[0]
+            dy = pos[1] - b.pos[1]
+            if dx * dx + dy * dy < b.radius * b.radius:
+                if self.grid.remove(b, *b.pos):
+                    self.free_cells.add(self.grid.cell_of(*b.pos))
+                b.kill()  # group repaints the background where it was
+                return True
+        return False
 
     def draw_bubbles(self):
-        self.screen.fill(WHITE)
-        for b in self.bubbles:
-            pygame.draw.circle(self.screen, b["color"], b["pos"], b["radius"])
-            shine_offset = b["radius"] // 3
-            shine_radius = b["radius"] // 4
-            pygame.draw.circle(self.screen, WHITE, (b["pos"][0] - shine_offset, b["pos"][1] - shine_offset), shine_radius)
+        """Redraw only the areas that changed. Returns the dirty rects."""
+        return self.bubbles.draw(self.screen)
 
     def run(self):
         while True:
@@ -73,23 +128,21 @@ class AvaGameBox:
                     if self.state == "SPLASH":
                         if self.btn_rect.collidepoint(pos):
                             self.state = "BUBBLES"
+                            # Splash was drawn outside the group: repaint it all once
+                            self.bubbles.repaint_rect(self.screen.get_rect())
                             for _ in range(10):
                                 self.spawn_bubble()
 
                     elif self.state == "BUBBLES":
-                        for i, b in enumerate(self.bubbles):
-                            dist = ((pos[0] - b["pos"][0])**2 + (pos[1] - b["pos"][1])**2)**0.5
-                            if dist < b["radius"]:
-                                self.bubbles.pop(i)
-                                self.spawn_bubble()
-                                break
+                        if self.pop_bubble_at(pos):
+                            self.spawn_bubble()
 
             if self.state == "SPLASH":
                 self.draw_splash()
+                pygame.display.flip()
             elif self.state == "BUBBLES":
-                self.draw_bubbles()
+                pygame.display.update(self.draw_bubbles())
 
-            pygame.display.flip()
             self.clock.tick(FPS)
 
 if __name__ == "__main__":
@@ -19,6 +19,8 @@ from screens.shows import ShowsScreen
 from screens.remote import RemoteScreen
 from screens.videos import VideosScreen
 
+IDLE_WAIT_MS = 1000  # longest event wait on screens with nothing animating
+
 
 def main():
     pygame.init()
@@ -26,6 +28,12 @@ def main():
     pygame.display.set_caption("Ava's Game Box")
     clock = pygame.time.Clock()
 
+    # Only queue the events we consume — drops touch FINGER*, window,
+    # joystick and audio events at the SDL level before they reach Python.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                              pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION])
+
     app = App()
 
     # Register all screens
@@ -44,7 +52,17 @@ def main():
     while True:
         dt = clock.tick(FPS) / 1000.0
 
-        for event in pygame.event.get():
+        if app.is_animated():
+            events = pygame.event.get()
+        else:
+            # Nothing moves on this screen: sleep until input arrives. Wake
+            # once a second anyway so the status indicators stay current.
+            event = pygame.event.wait(IDLE_WAIT_MS)
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events += pygame.event.get()
+            clock.tick()  # the sleep isn't frame time
+
+        for event in events:
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -55,8 +73,13 @@ def main():
             app.handle_event(event)
 
         app.update(dt)
-        app.draw(screen)
-        pygame.display.flip()
+        dirty = app.draw(screen)
+        # Screens that know what changed return dirty rects; the rest
+        # (None) get a full-screen flip
+        if dirty is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
 
 
 if __name__ == "__main__":
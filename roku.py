@@ -1,37 +1,80 @@
-# roku.py — Roku HTTP helper (urllib, threaded)
+# roku.py — Roku HTTP helper (keep-alive http.client, one worker thread)
 
+import http.client
+import queue
 import threading
-import urllib.request
 from config import ROKU_IP, ROKU_PORT
 
 # Set to False to disable all Roku commands (no network calls)
 ENABLED = True
 
+# One keep-alive connection, used only by the worker thread. Reusing it
+# skips the TCP handshake per keypress.
+_conn = None
 
-def _post(url):
+# Commands are queued and sent in order by a single daemon worker, so
+# callers never pay for thread creation and requests never interleave.
+_q = queue.SimpleQueue()
+
+
+def _post(path):
     """Fire-and-forget POST with timeout. Silent on errors."""
-    if not ENABLED:
+    global _conn
+    # A reused socket may have been closed by the Roku while idle —
+    # if sending the request fails on it, reconnect and try once more.
+    # Never retry once the request has gone out, or a keypress could
+    # reach the Roku twice.
+    for _ in range(2):
+        reused = _conn is not None
+        try:
+            if _conn is None:
+                _conn = http.client.HTTPConnection(ROKU_IP, ROKU_PORT, timeout=3)
+            _conn.request("POST", path, body=b"")
+        except (ConnectionResetError, BrokenPipeError,
+                http.client.RemoteDisconnected):
+            _close()
+            if not reused:
+                return
+            continue
+        except Exception:
+            _close()
+            return
+        try:
+            _conn.getresponse().read()
+        except Exception:
+            _close()
         return
-    try:
-        req = urllib.request.Request(url, data=b"", method="POST")
-        urllib.request.urlopen(req, timeout=3)
-    except Exception:
-        pass
+
+
+def _close():
+    """Drop the keep-alive connection; the next _post reconnects."""
+    global _conn
+    if _conn is not None:
+        _conn.close()
+    _conn = None
+
+
+def _worker():
+    while True:
+        _post(_q.get())
+
+
+threading.Thread(target=_worker, daemon=True).start()
 
 
 def launch_show(channel_id, content_id, media_type):
-    """Launch a show on Roku via ECP deep link (threaded)."""
+    """Launch a show on Roku via ECP deep link (queued)."""
     if not ENABLED:
         return
-    url = f"http://{ROKU_IP}:{ROKU_PORT}/launch/{channel_id}"
+    path = f"/launch/{channel_id}"
     if content_id:
-        url += f"?ContentID={content_id}&MediaType={media_type}"
-    threading.Thread(target=_post, args=(url,), daemon=True).start()
+        path += f"?ContentID={content_id}&MediaType={media_type}"
+    _q.put(path)
 
 
 def send_keypress(key):
-    """Send a keypress to Roku (threaded)."""
+    """Send a keypress to Roku (queued)."""
     if not ENABLED:
         return
-    url = f"http://{ROKU_IP}:{ROKU_PORT}/keypress/{key}"
-    threading.Thread(target=_post, args=(url,), daemon=True).start()
+    path = f"/keypress/{key}"
+    _q.put(path)
@@ -30,6 +30,11 @@ STAMP_BTN_SIZE = 56
 CLEAR_BTN_W = 90
 CLEAR_BTN_H = 44
 
+# Star vertices on the unit circle: (cos, sin, radius factor), outer/inner alternating
+_STAR_UNIT = [(math.cos(math.radians(i * 36 - 90)),
+               math.sin(math.radians(i * 36 - 90)),
+               1.0 if i % 2 == 0 else 0.4) for i in range(10)]
+
 
 class FingerPaintScreen:
     def __init__(self, app):
@@ -41,6 +46,8 @@ class FingerPaintScreen:
         self.brush_size = BRUSH_SIZES[1]  # medium
         self.brush_index = 1
         self.stamp_mode = None        # None, "star", "heart", "paw"
+        self._stamp_cache = {}        # (kind, size, color) -> Surface
+        self._brush_cache = {}        # (radius, color) -> brush dot Surface
 
     # ------------------------------------------------------------------ #
     def on_enter(self):
@@ -83,18 +90,17 @@ class FingerPaintScreen:
                 else:
                     self.drawing = True
                     self.last_pos = (mx, my)
-                    pygame.draw.circle(self.canvas, self.color,
-                                       (mx, my), self.brush_size)
+                    r = self.brush_size
+                    self.canvas.blit(self._brush_stamp(), (mx - r, my - r))
 
         elif event.type == pygame.MOUSEMOTION and self.drawing:
             mx, my = event.pos
             if my < TOOLBAR_Y:
-                pygame.draw.circle(self.canvas, self.color,
-                                   (mx, my), self.brush_size)
                 if self.last_pos:
-                    pygame.draw.line(self.canvas, self.color,
-                                    self.last_pos, (mx, my),
-                                    self.brush_size * 2)
+                    self._stroke(self.last_pos, (mx, my))
+                else:
+                    r = self.brush_size
+                    self.canvas.blit(self._brush_stamp(), (mx - r, my - r))
                 self.last_pos = (mx, my)
             else:
                 self.last_pos = None
@@ -103,10 +109,36 @@ class FingerPaintScreen:
             self.drawing = False
             self.last_pos = None
 
+    # ------------------------------------------------------------------ #
+    def _brush_stamp(self):
+        """Return a filled dot for the current brush size and color (cached)."""
+        key = (self.brush_size, self.color)
+        stamp = self._brush_cache.get(key)
+        if stamp is None:
+            r = self.brush_size
+            stamp = pygame.Surface((r * 2 + 1, r * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, self.color, (r, r), r)
+            self._brush_cache[key] = stamp
+        return stamp
+
+    def _stroke(self, start, end):
+        """Stamp the brush dot along start -> end, every half radius."""
+        stamp = self._brush_stamp()
+        r = self.brush_size
+        x0, y0 = start
+        dx, dy = end[0] - x0, end[1] - y0
+        steps = max(1, max(abs(dx), abs(dy)) // max(1, r // 2))
+        self.canvas.blits([(stamp, (x0 + dx * i // steps - r, y0 + dy * i // steps - r))
+                           for i in range(1, steps + 1)], doreturn=False)
+
     # ------------------------------------------------------------------ #
     def update(self, dt):
         pass  # no animations needed
 
+    def is_animated(self):
+        """The canvas only changes in response to touches."""
+        return False
+
     # ------------------------------------------------------------------ #
     def draw(self, surface):
         # Blit the persistent canvas
@@ -181,7 +213,8 @@ class FingerPaintScreen:
             if self.stamp_mode == stamp:
                 pygame.draw.rect(surface, (200, 140, 255), rect, width=3, border_radius=10)
             # Draw the stamp icon preview
-            self._draw_stamp_icon(surface, stamp, cx, cy, 16, WHITE)
+            icon = self._stamp_surface(stamp, 16, WHITE)
+            surface.blit(icon, icon.get_rect(center=(cx, cy)))
 
     def _draw_clear_button(self, surface):
         """Draw the clear button top-right."""
@@ -215,9 +248,11 @@ class FingerPaintScreen:
         # Brush sizes
         palette_end_x = SWATCH_PAD + 8 * (SWATCH_SIZE + SWATCH_PAD) + 10
         cy = TOOLBAR_Y + TOOLBAR_HEIGHT // 2
+        hit_r = BRUSH_BTN_SIZE // 2 + 4
         for i in range(3):
             cx = palette_end_x + i * (BRUSH_BTN_SIZE + 8) + BRUSH_BTN_SIZE // 2
-            if math.hypot(mx - cx, my - cy) <= BRUSH_BTN_SIZE // 2 + 4:
+            dx, dy = mx - cx, my - cy
+            if dx * dx + dy * dy <= hit_r * hit_r:
                 self.brush_index = i
                 self.brush_size = BRUSH_SIZES[i]
                 self.stamp_mode = None
@@ -241,12 +276,21 @@ class FingerPaintScreen:
 
     def _draw_stamp(self, x, y):
         """Draw the selected stamp onto the canvas at (x, y)."""
-        if self.stamp_mode == "star":
-            self._draw_stamp_icon(self.canvas, "star", x, y, 30, self.color)
-        elif self.stamp_mode == "heart":
-            self._draw_stamp_icon(self.canvas, "heart", x, y, 30, self.color)
-        elif self.stamp_mode == "paw":
-            self._draw_stamp_icon(self.canvas, "paw", x, y, 30, self.color)
+        if self.stamp_mode:
+            stamp = self._stamp_surface(self.stamp_mode, 30, self.color)
+            self.canvas.blit(stamp, stamp.get_rect(center=(x, y)))
+
+    def _stamp_surface(self, kind, size, color):
+        """Return the stamp icon pre-rendered on a transparent surface (cached)."""
+        key = (kind, size, color)
+        surf = self._stamp_cache.get(key)
+        if surf is None:
+            # Every shape stays within size of its center
+            half = size + 1
+            surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            self._draw_stamp_icon(surf, kind, half, half, size, color)
+            self._stamp_cache[key] = surf
+        return surf
 
     def _draw_stamp_icon(self, surface, kind, cx, cy, size, color):
         """Render a stamp icon centered at (cx, cy) with given size."""
@@ -259,12 +303,7 @@ class FingerPaintScreen:
 
     def _draw_star(self, surface, cx, cy, size, color):
         """Draw a 5-pointed star."""
-        points = []
-        for i in range(10):
-            angle = math.radians(i * 36 - 90)
-            r = size if i % 2 == 0 else size * 0.4
-            points.append((cx + r * math.cos(angle),
-                           cy + r * math.sin(angle)))
+        points = [(cx + size * k * c, cy + size * k * s) for c, s, k in _STAR_UNIT]
         pygame.draw.polygon(surface, color, points)
 
     def _draw_heart(self, surface, cx, cy, size, color):
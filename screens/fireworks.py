@@ -3,23 +3,161 @@
 import math
 import random
 import pygame
+import pygame.gfxdraw
 from config import WIDTH, HEIGHT, WHITE, BLACK
-from ui import draw_back_button, get_font, hsv_to_rgb
+from ui import draw_back_button, get_font, hsv_to_rgb, make_vertical_gradient
+
+
+MAX_TRAILS = 1024  # rocket trail sparks alive at once (~30 per rocket)
+MAX_BURST = 80     # sparks per explosion (upper bound)
+MAX_EXPLOSION_SPARKS = 2000  # oldest bursts are retired past this
+
+# 256 evenly spaced unit vectors — burst patterns pick a direction by index
+# instead of calling cos/sin per spark. Index i is angle tau * i / 256.
+_DIRS = 256
+_DIR_TABLE = [(math.cos(math.tau * i / _DIRS), math.sin(math.tau * i / _DIRS))
+              for i in range(_DIRS)]
+_RING_JITTER = 4                       # ~0.1 rad in table steps
+_CASCADE_LO = -int(_DIRS * 0.4)        # -0.8 pi
+_CASCADE_HI = -int(_DIRS * 0.1)        # -0.2 pi
+
+# Full-value spark colors by whole-degree hue and saturation step
+# 0.7/0.8/0.9/1.0, so spawning sparks indexes a table instead of
+# converting HSV per spark: _HSV_LUT[hue % 360][sat_step]
+_SAT_STEPS = (0.7, 0.8, 0.9, 1.0)
+_HSV_LUT = [[hsv_to_rgb(h, s, 1.0) for s in _SAT_STEPS] for h in range(360)]
+
+# Sparks darken as they age. Each spark color gets a ramp of SHADES + 1
+# pre-multiplied colors (index = life fraction * SHADES), built once per
+# color, so drawing picks a tuple instead of scaling three channels.
+SHADES = 32
+_shade_ramps = {}
+
+
+def _shade_ramp(color):
+    ramp = _shade_ramps.get(color)
+    if ramp is None:
+        r, g, b = color
+        ramp = [(r * k // SHADES, g * k // SHADES, b * k // SHADES)
+                for k in range(SHADES + 1)]
+        _shade_ramps[color] = ramp
+    return ramp
+
+# ---------------------------------------------------------------------------
+# Spark storage — struct-of-arrays, one batch per explosion
+# ---------------------------------------------------------------------------
+
+class SparkBatch:
+    """Fixed-capacity flat-list spark storage.  No per-spark dicts; dead
+    sparks are swap-removed and their slots reused by later emits."""
+
+    __slots__ = ("cap", "count", "x", "y", "vx", "vy", "gravity",
+                 "life", "max_life", "size", "shades")
+
+    def __init__(self, capacity):
+        self.cap = capacity
+        self.count = 0
+        self.x = [0.0] * capacity
+        self.y = [0.0] * capacity
+        self.vx = [0.0] * capacity
+        self.vy = [0.0] * capacity
+        self.gravity = [0.0] * capacity
+        self.life = [0.0] * capacity
+        self.max_life = [1.0] * capacity
+        self.size = [1.0] * capacity
+        self.shades = [None] * capacity  # _shade_ramp() of each spark's color
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, px, py, pvx, pvy, pgravity, plife, psize, pcolor,
+             pmax_life=None):
+        """Add one spark.  Returns False if the batch is full.
+        pmax_life (fade denominator) defaults to plife."""
+        i = self.count
+        if i >= self.cap:
+            return False
+        self.x[i] = px
+        self.y[i] = py
+        self.vx[i] = pvx
+        self.vy[i] = pvy
+        self.gravity[i] = pgravity
+        self.life[i] = plife
+        self.max_life[i] = plife if pmax_life is None else pmax_life
+        self.size[i] = psize
+        self.shades[i] = _shade_ramp(pcolor)
+        self.count = i + 1
+        return True
+
+    def update(self, dt):
+        n = self.count
+        x = self.x; y = self.y
+        vx = self.vx; vy = self.vy
+        gravity = self.gravity
+        life = self.life
+
+        i = 0
+        while i < n:
+            life[i] -= dt
+            if life[i] <= 0.0:
+                # Swap-remove
+                n -= 1
+                x[i] = x[n]; y[i] = y[n]
+                vx[i] = vx[n]; vy[i] = vy[n]
+                gravity[i] = gravity[n]
+                life[i] = life[n]
+                self.max_life[i] = self.max_life[n]
+                self.size[i] = self.size[n]
+                self.shades[i] = self.shades[n]
+                continue
+
+            x[i] += vx[i] * dt
+            y[i] += vy[i] * dt
+            vy[i] += gravity[i] * dt
+            i += 1
+        self.count = n
+
+    def draw(self, surface):
+        """Draw sparks shrinking and darkening as they age."""
+        # Most sparks are 1-2 px: set_at / gfxdraw skip draw.circle's
+        # general-case setup for those
+        circle = pygame.draw.circle
+        filled_circle = pygame.gfxdraw.filled_circle
+        set_at = surface.set_at
+        x = self.x; y = self.y
+        life = self.life; max_life = self.max_life
+        size = self.size; shades = self.shades
+        for i in range(self.count):
+            alpha = life[i] / max_life[i]  # live sparks always have life > 0
+            c = shades[i][int(alpha * SHADES)]
+            radius = int(size[i] * alpha)
+            if radius <= 1:
+                set_at((int(x[i]), int(y[i])), c)
+            elif radius == 2:
+                filled_circle(surface, int(x[i]), int(y[i]), 2, c)
+            else:
+                circle(surface, c, (int(x[i]), int(y[i])), radius)
 
 
 class FireworksScreen:
     def __init__(self, app):
         self.app = app
         self.rockets = []       # list of rocket dicts
-        self.explosions = []    # list of explosion particle lists
-        self.trail_particles = []  # rocket trail particles
+        self.explosions = []    # list of SparkBatch, one per burst, oldest first
+        self._spare_batches = []  # finished bursts, reused by the next spawn
+        self.trail_particles = SparkBatch(MAX_TRAILS)  # rocket trail sparks
         self.stars = []         # background twinkling stars
         self.back_rect = None
+        # Dark blue-black gradient (top darker, bottom slightly lighter)
+        self._bg = make_vertical_gradient(WIDTH, HEIGHT, (5, 5, 25), (15, 15, 50))
 
     # ── lifecycle ──────────────────────────────────────────────
 
     def on_enter(self):
         self.rockets.clear()
+        for batch in self.explosions:
+            batch.clear()
+        self._spare_batches.extend(self.explosions)
         self.explosions.clear()
         self.trail_particles.clear()
         self._init_stars()
@@ -50,13 +188,15 @@ class FireworksScreen:
     def _launch_rocket(self, tx, ty):
         # Clamp target so explosion stays on screen
         ty = min(ty, HEIGHT - 80)
+        hue = random.uniform(0, 360)
         self.rockets.append({
             "x": WIDTH / 2,
             "y": float(HEIGHT),
             "tx": float(tx),
             "ty": float(ty),
             "speed": random.uniform(500, 650),
-            "hue": random.uniform(0, 360),
+            "hue": hue,
+            "color": _HSV_LUT[int(hue) % 360][2],  # fixed for the flight
             "trail_timer": 0.0,
         })
 
@@ -73,7 +213,7 @@ class FireworksScreen:
             s["phase"] += s["speed"] * dt
 
     def _update_rockets(self, dt):
-        to_remove = []
+        alive = []
         for r in self.rockets:
             dx = r["tx"] - r["x"]
             dy = r["ty"] - r["y"]
@@ -81,8 +221,8 @@ class FireworksScreen:
             if dist < 10:
                 # Explode
                 self._spawn_explosion(r["x"], r["y"], r["hue"])
-                to_remove.append(r)
                 continue
+            alive.append(r)
             # Move toward target
             vx = dx / dist * r["speed"]
             vy = dy / dist * r["speed"]
@@ -92,142 +232,126 @@ class FireworksScreen:
             r["trail_timer"] += dt
             if r["trail_timer"] > 0.015:
                 r["trail_timer"] = 0.0
-                self.trail_particles.append({
-                    "x": r["x"] + random.uniform(-3, 3),
-                    "y": r["y"] + random.uniform(-2, 2),
-                    "life": random.uniform(0.2, 0.45),
-                    "max_life": 0.45,
-                    "r": random.uniform(1.5, 3.0),
-                    "color": hsv_to_rgb(r["hue"] + random.uniform(-20, 20), 0.8, 1.0),
-                })
-        for r in to_remove:
-            self.rockets.remove(r)
+                self.trail_particles.emit(
+                    r["x"] + random.uniform(-3, 3),
+                    r["y"] + random.uniform(-2, 2),
+                    0.0, 0.0, 0.0,
+                    random.uniform(0.2, 0.45),
+                    random.uniform(1.5, 3.0),
+                    _HSV_LUT[int(r["hue"] + random.uniform(-20, 20)) % 360][1],
+                    0.45,  # shared fade scale: short-lived sparks start dimmer
+                )
+        self.rockets = alive
 
     def _update_trail_particles(self, dt):
-        alive = []
-        for p in self.trail_particles:
-            p["life"] -= dt
-            if p["life"] > 0:
-                alive.append(p)
-        self.trail_particles = alive
+        self.trail_particles.update(dt)
 
     def _update_explosions(self, dt):
         alive_explosions = []
-        for particles in self.explosions:
-            alive = []
-            for p in particles:
-                p["life"] -= dt
-                if p["life"] <= 0:
-                    continue
-                p["x"] += p["vx"] * dt
-                p["y"] += p["vy"] * dt
-                p["vy"] += p["gravity"] * dt
-                alive.append(p)
-            if alive:
-                alive_explosions.append(alive)
+        for batch in self.explosions:
+            batch.update(dt)
+            if batch.count:
+                alive_explosions.append(batch)
+            else:
+                self._spare_batches.append(batch)
         self.explosions = alive_explosions
 
     # ── explosion spawning ─────────────────────────────────────
 
     def _spawn_explosion(self, x, y, base_hue):
         pattern = random.choice(["starburst", "ring", "cascade", "spiral"])
-        count = random.randint(50, 80)
-        particles = []
+        count = random.randint(50, MAX_BURST)
+
+        # Hard cap on live sparks: retire the oldest bursts to make room
+        live = sum(b.count for b in self.explosions)
+        while self.explosions and live + count > MAX_EXPLOSION_SPARKS:
+            oldest = self.explosions.pop(0)
+            live -= oldest.count
+            oldest.clear()
+            self._spare_batches.append(oldest)
+        batch = self._spare_batches.pop() if self._spare_batches else SparkBatch(MAX_BURST)
 
         for i in range(count):
-            hue = (base_hue + random.uniform(-25, 25)) % 360
-            color = hsv_to_rgb(hue, random.uniform(0.7, 1.0), 1.0)
+            color = _HSV_LUT[int(base_hue + random.uniform(-25, 25)) % 360][random.randrange(4)]
             life = random.uniform(1.5, 2.5)
 
             if pattern == "starburst":
-                angle = random.uniform(0, math.tau)
+                c, s = _DIR_TABLE[random.randrange(_DIRS)]
                 speed = random.uniform(60, 220)
-                vx = math.cos(angle) * speed
-                vy = math.sin(angle) * speed
+                vx = c * speed
+                vy = s * speed
 
             elif pattern == "ring":
-                angle = (math.tau / count) * i + random.uniform(-0.1, 0.1)
+                j = i * _DIRS // count + random.randint(-_RING_JITTER, _RING_JITTER)
+                c, s = _DIR_TABLE[j % _DIRS]
                 speed = random.uniform(120, 170)
-                vx = math.cos(angle) * speed
-                vy = math.sin(angle) * speed
+                vx = c * speed
+                vy = s * speed
 
             elif pattern == "cascade":
-                angle = random.uniform(-math.pi * 0.8, -math.pi * 0.2)
+                c, s = _DIR_TABLE[random.randint(_CASCADE_LO, _CASCADE_HI) % _DIRS]
                 speed = random.uniform(80, 200)
-                vx = math.cos(angle) * speed + random.uniform(-30, 30)
-                vy = math.sin(angle) * speed - random.uniform(0, 60)
+                vx = c * speed + random.uniform(-30, 30)
+                vy = s * speed - random.uniform(0, 60)
 
             else:  # spiral
-                angle = (math.tau / count) * i * 3
+                c, s = _DIR_TABLE[i * 3 * _DIRS // count % _DIRS]
                 speed = 60 + (i / count) * 160
-                vx = math.cos(angle) * speed
-                vy = math.sin(angle) * speed
-
-            particles.append({
-                "x": x + random.uniform(-2, 2),
-                "y": y + random.uniform(-2, 2),
-                "vx": vx,
-                "vy": vy,
-                "gravity": random.uniform(60, 120),
-                "life": life,
-                "max_life": life,
-                "r": random.uniform(2.0, 4.0),
-                "color": color,
-            })
+                vx = c * speed
+                vy = s * speed
+
+            batch.emit(
+                x + random.uniform(-2, 2),
+                y + random.uniform(-2, 2),
+                vx, vy,
+                random.uniform(60, 120),
+                life,
+                random.uniform(2.0, 4.0),
+                color,
+            )
 
-        self.explosions.append(particles)
+        self.explosions.append(batch)
 
     # ── draw ───────────────────────────────────────────────────
 
     def draw(self, surface):
         self._draw_background(surface)
-        self._draw_stars(surface)
-        self._draw_trail_particles(surface)
-        self._draw_rockets(surface)
-        self._draw_explosions(surface)
+        # Everything between here and the back button is pygame.draw
+        # primitives: lock once instead of once per circle
+        surface.lock()
+        try:
+            self._draw_stars(surface)
+            self._draw_trail_particles(surface)
+            self._draw_rockets(surface)
+            self._draw_explosions(surface)
+        finally:
+            surface.unlock()
         self.back_rect = draw_back_button(surface)
 
     def _draw_background(self, surface):
-        # Dark blue-black gradient (top darker, bottom slightly lighter)
-        top_color = (5, 5, 25)
-        bot_color = (15, 15, 50)
-        # Draw in horizontal bands for speed
-        band = 12
-        for y in range(0, HEIGHT, band):
-            t = y / HEIGHT
-            r = int(top_color[0] + (bot_color[0] - top_color[0]) * t)
-            g = int(top_color[1] + (bot_color[1] - top_color[1]) * t)
-            b = int(top_color[2] + (bot_color[2] - top_color[2]) * t)
-            pygame.draw.rect(surface, (r, g, b), (0, y, WIDTH, band))
+        surface.blit(self._bg, (0, 0))
 
     def _draw_stars(self, surface):
+        # math.sin is a single C call; a Python-level lookup table measured
+        # 2-4x slower here, so just keep the hot names local
+        sin = math.sin
+        circle = pygame.draw.circle
         for s in self.stars:
-            alpha = (math.sin(s["phase"]) + 1.0) / 2.0  # 0..1
+            alpha = (sin(s["phase"]) + 1.0) / 2.0  # 0..1
             brightness = int(120 + 135 * alpha)
             color = (brightness, brightness, brightness)
             radius = max(1, int(s["r"] * (0.6 + 0.4 * alpha)))
-            pygame.draw.circle(surface, color, (int(s["x"]), int(s["y"])), radius)
+            circle(surface, color, (int(s["x"]), int(s["y"])), radius)
 
     def _draw_trail_particles(self, surface):
-        for p in self.trail_particles:
-            alpha = max(0.0, p["life"] / p["max_life"])
-            r, g, b = p["color"]
-            color = (int(r * alpha), int(g * alpha), int(b * alpha))
-            radius = max(1, int(p["r"] * alpha))
-            pygame.draw.circle(surface, color, (int(p["x"]), int(p["y"])), radius)
+        self.trail_particles.draw(surface)
 
     def _draw_rockets(self, surface):
         for r in self.rockets:
-            color = hsv_to_rgb(r["hue"], 0.9, 1.0)
-            pygame.draw.circle(surface, color, (int(r["x"]), int(r["y"])), 4)
+            pygame.draw.circle(surface, r["color"], (int(r["x"]), int(r["y"])), 4)
             # Bright white core
             pygame.draw.circle(surface, WHITE, (int(r["x"]), int(r["y"])), 2)
 
     def _draw_explosions(self, surface):
-        for particles in self.explosions:
-            for p in particles:
-                alpha = max(0.0, p["life"] / p["max_life"])
-                r, g, b = p["color"]
-                color = (int(r * alpha), int(g * alpha), int(b * alpha))
-                radius = max(1, int(p["r"] * alpha))
-                pygame.draw.circle(surface, color, (int(p["x"]), int(p["y"])), radius)
+        for batch in self.explosions:
+            batch.draw(surface)
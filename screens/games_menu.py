@@ -7,6 +7,19 @@ from config import (WIDTH, HEIGHT, SKY_BLUE, WHITE, BACK_BTN_SIZE, BACK_BTN_MARG
                     FIREWORKS, PARTICLE_PLAYGROUND, WEATHER_TOY)
 from ui import draw_back_button, draw_3d_card, get_font, PressTracker
 
+# Sparkle icon rays: ray j points at j * 45 degrees and its length wobbles
+# with sin(5t + j). Both are rotated per frame by angle addition from this
+# fixed table, so a frame needs 4 trig calls instead of 40.
+# Per ray: (cos, sin) of its direction, (cos j, sin j), color.
+_SPARKLE_COLORS = ((255, 100, 255), (100, 200, 255), (255, 255, 100), (100, 255, 150))
+_SPARKLE_RAYS = tuple((math.cos(j * math.pi / 4), math.sin(j * math.pi / 4),
+                       math.cos(j), math.sin(j), _SPARKLE_COLORS[j & 3])
+                      for j in range(8))
+
+# Flower icon petals: unit vectors at 0, 72, ... 288 degrees
+_FLOWER_OFFSETS = tuple((math.cos(math.radians(a)), math.sin(math.radians(a)))
+                        for a in range(0, 360, 72))
+
 
 class GamesMenuScreen:
     def __init__(self, app):
@@ -40,13 +53,69 @@ class GamesMenuScreen:
                       "FIREWORKS", "PARTICLES", "WEATHER TOY"]
         self.icons = ["paint", "shapes", "flower", "rocket", "sparkle", "cloud"]
         self.back_rect = None
+
+        # Per-card drawer for the moving part of its icon (None if static)
+        anim_drawers = {"rocket": self._draw_rocket_anim,
+                        "sparkle": self._draw_sparkle_anim,
+                        "cloud": self._draw_cloud_anim}
+        self.icon_anims = [anim_drawers.get(icon) for icon in self.icons]
+
+        # Card names never change: render them once
+        font = get_font(26)
+        self.label_surfs = [font.render(name, True, WHITE) for name in self.names]
+
+        # Static icon parts never change: rasterize them once per card,
+        # cropped to what was drawn (a smaller alpha blit), with the crop's
+        # offset from the icon center. Sized from the unpressed face (card
+        # height minus the 3px depth). None where the whole icon animates.
+        self.icon_surfs = []
+        self.icon_offsets = []
+        for card, icon in zip(self.cards, self.icons):
+            face_h = card.height - 3
+            half = int(50 * face_h / 185.0) + 2
+            surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+            self._draw_icon_static(surf, icon, half, half, face_h)
+            used = surf.get_bounding_rect()
+            self.icon_surfs.append(surf.subsurface(used).copy() if used.width else None)
+            self.icon_offsets.append((used.x - half, used.y - half))
+
+        # Card faces never move except for the fixed pressed offset, so the
+        # icon center and label rect are known up front for both states.
+        # Per card: (unpressed, pressed), each (cx, icon_cy, label_rect, k)
+        # where k is the icon's animated-part constants pre-scaled to the face
+        self.card_layout = []
+        for card, icon, text_surf in zip(self.cards, self.icons, self.label_surfs):
+            states = []
+            for face, off in ((pygame.Rect(card.x, card.y, card.width, card.height - 3), 0),
+                              (pygame.Rect(card.x + 1, card.y + 2, card.width - 2, card.height - 2), 2)):
+                fcx, fy, fh = face.centerx, face.y, face.height
+                label_rect = text_surf.get_rect(center=(fcx, fy + fh * 0.78 + off))
+                states.append((fcx, int(fy + fh * 0.38) + off, label_rect,
+                               self._scale_anim(icon, fh)))
+            self.card_layout.append(tuple(states))
+
+        # Everything but the animated icon parts is static while a card is
+        # unpressed: bake the sky and all six resting cards into one surface.
+        # A card's footprint covers its shadow and bottom edge (draw_3d_card
+        # extends 6px right and 9px below the rect).
+        self._bg = pygame.Surface((WIDTH, HEIGHT))
+        self._bg.fill(SKY_BLUE)
+        self.card_areas = []
+        for i, card in enumerate(self.cards):
+            draw_3d_card(self._bg, card, self.colors[i], 18, False)
+            cx, icy, label_rect, _ = self.card_layout[i][False]
+            self._bg.blits(self._card_blits(i, cx, icy, label_rect), doreturn=False)
+            self.card_areas.append(pygame.Rect(card.x, card.y, card.width + 6, card.height + 9))
+
         self.press = PressTracker(6)
-        self.pending_nav = None
+        self.pending_state = None
+        self.pending_timer = 0.0
         self.time = 0.0
 
     def on_enter(self):
         self.press = PressTracker(6)
-        self.pending_nav = None
+        self.pending_state = None
+        self.pending_timer = 0.0
         self.time = 0.0
 
     def handle_event(self, event):
@@ -58,44 +127,64 @@ class GamesMenuScreen:
             for i, card in enumerate(self.cards):
                 if card.collidepoint(pos):
                     self.press.trigger(i)
-                    self.pending_nav = (self.states[i], 0.12)
+                    self.pending_state = self.states[i]
+                    self.pending_timer = 0.12
                     break
 
     def update(self, dt):
         self.time += dt
         self.press.update(dt)
-        if self.pending_nav:
-            state, timer = self.pending_nav
-            timer -= dt
-            if timer <= 0:
-                self.pending_nav = None
+        if self.pending_state:
+            self.pending_timer -= dt
+            if self.pending_timer <= 0:
+                state = self.pending_state
+                self.pending_state = None
                 self.app.go_to(state)
-            else:
-                self.pending_nav = (state, timer)
 
     def draw(self, surface):
-        surface.fill(SKY_BLUE)
+        surface.blit(self._bg, (0, 0))
 
+        # Only pressed cards differ from the baked background: clear their
+        # footprint and draw them live. Their icons and labels never overlap
+        # another card, so those go out afterwards in one blits() call, then
+        # every card's animated icon part on top
+        blit_list = []
+        anim = []
         for i, card in enumerate(self.cards):
             pressed = self.press.is_pressed(i)
-            face = draw_3d_card(surface, card, self.colors[i], 18, pressed)
-
-            # Draw icon — centered in upper portion of card
-            cx = face.centerx
-            icon_cy = face.y + face.height * 0.38
-            off = 2 if pressed else 0
-            self._draw_icon(surface, self.icons[i], cx, int(icon_cy) + off, face.height)
+            cx, icy, label_rect, k = self.card_layout[i][pressed]
+            if pressed:
+                surface.fill(SKY_BLUE, self.card_areas[i])
+                draw_3d_card(surface, card, self.colors[i], 18, True)
+                blit_list.extend(self._card_blits(i, cx, icy, label_rect))
+            if self.icon_anims[i]:
+                anim.append((self.icon_anims[i], cx, icy, k))
 
-            # Name — larger font, in lower portion
-            font = get_font(26)
-            text_surf = font.render(self.names[i], True, WHITE)
-            text_rect = text_surf.get_rect(center=(face.centerx, face.y + face.height * 0.78 + off))
-            surface.blit(text_surf, text_rect)
+        if blit_list:
+            surface.blits(blit_list, doreturn=False)
+        # The animated parts are all pygame.draw primitives: lock once
+        # instead of once per line/circle
+        surface.lock()
+        try:
+            for drawer, cx, icy, k in anim:
+                drawer(surface, cx, icy, k)
+        finally:
+            surface.unlock()
 
         # Back button on top of everything
         self.back_rect = draw_back_button(surface)
 
-    def _draw_icon(self, surface, icon, cx, cy, card_h):
+    def _card_blits(self, i, cx, icy, label_rect):
+        """(surface, dest) pairs for card i's static icon and name label."""
+        blits = []
+        if self.icon_surfs[i]:
+            ox, oy = self.icon_offsets[i]
+            blits.append((self.icon_surfs[i], (cx + ox, icy + oy)))
+        blits.append((self.label_surfs[i], label_rect))
+        return blits
+
+    def _draw_icon_static(self, surface, icon, cx, cy, card_h):
+        """Draw the parts of an icon that don't move (cached in icon_surfs)."""
         # Scale factor based on card size (larger cards = larger icons)
         s = card_h / 185.0  # normalize to original card height
         if icon == "paint":
@@ -115,11 +204,11 @@ class GamesMenuScreen:
             pygame.draw.rect(surface, (255, 130, 130),
                              (cx + int(6*s), cy + int(2*s), int(28*s), int(28*s)))
         elif icon == "flower":
-            for angle in range(0, 360, 72):
-                rad = math.radians(angle)
-                px = cx + int(20*s * math.cos(rad))
-                py = cy + int(20*s * math.sin(rad))
-                pygame.draw.circle(surface, (255, 180, 200), (px, py), int(13*s))
+            r = 20 * s
+            petal_r = int(13*s)
+            for ux, uy in _FLOWER_OFFSETS:
+                pygame.draw.circle(surface, (255, 180, 200),
+                                   (cx + int(r * ux), cy + int(r * uy)), petal_r)
             pygame.draw.circle(surface, (255, 220, 80), (cx, cy), int(11*s))
             pygame.draw.line(surface, (80, 180, 80),
                              (cx, cy + int(20*s)), (cx, cy + int(42*s)), max(2, int(4*s)))
@@ -130,29 +219,60 @@ class GamesMenuScreen:
                                  (cx + int(14*s), cy + int(8*s))])
             pygame.draw.rect(surface, (200, 200, 200),
                              (cx - int(11*s), cy + int(8*s), int(22*s), int(14*s)))
-            bob = math.sin(self.time * 12) * int(4*s)
-            pygame.draw.polygon(surface, (255, 160, 40),
-                                [(cx - int(8*s), cy + int(22*s)),
-                                 (cx, cy + int(35*s) + bob),
-                                 (cx + int(8*s), cy + int(22*s))])
-        elif icon == "sparkle":
-            for j in range(8):
-                angle = j * (math.pi / 4) + self.time * 2
-                length = int((20 + math.sin(self.time * 5 + j) * 7) * s)
-                x1 = cx + int(8*s * math.cos(angle))
-                y1 = cy + int(8*s * math.sin(angle))
-                x2 = cx + int(length * math.cos(angle))
-                y2 = cy + int(length * math.sin(angle))
-                col = [(255, 100, 255), (100, 200, 255), (255, 255, 100), (100, 255, 150)][j % 4]
-                pygame.draw.line(surface, col, (x1, y1), (x2, y2), max(2, int(3*s)))
-            pygame.draw.circle(surface, WHITE, (cx, cy), int(7*s))
         elif icon == "cloud":
             pygame.draw.circle(surface, WHITE, (cx - int(16*s), cy - int(8*s)), int(20*s))
             pygame.draw.circle(surface, WHITE, (cx + int(16*s), cy - int(8*s)), int(20*s))
             pygame.draw.circle(surface, WHITE, (cx, cy - int(20*s)), int(20*s))
             pygame.draw.rect(surface, WHITE,
                              (cx - int(28*s), cy - int(12*s), int(56*s), int(16*s)))
-            for j in range(3):
-                dy = (self.time * 40 + j * 15) % int(35*s)
-                pygame.draw.circle(surface, (100, 180, 255),
-                                   (cx - int(16*s) + int(j * 16*s), int(cy + 12*s + dy)), int(4*s))
+
+    def _scale_anim(self, icon, card_h):
+        """Pre-scale the constants an icon's anim drawer needs for a face height."""
+        s = card_h / 185.0
+        if icon == "rocket":
+            return (int(8*s), int(22*s), int(35*s), int(4*s))
+        if icon == "sparkle":
+            return (s, 8 * s, max(2, int(3*s)), int(7*s))
+        if icon == "cloud":
+            # Per raindrop: (x offset, phase)
+            drops = tuple((-int(16*s) + int(j * 16*s), j * 15) for j in range(3))
+            return (int(35*s), drops, 12 * s, int(4*s))
+        return None
+
+    # Animated icon parts, drawn on top of the cached static part.
+    # k is the icon's constants from _scale_anim.
+
+    def _draw_rocket_anim(self, surface, cx, cy, k):
+        half_w, top, tip, bob_amp = k
+        bob = math.sin(self.time * 12) * bob_amp
+        pygame.draw.polygon(surface, (255, 160, 40),
+                            [(cx - half_w, cy + top),
+                             (cx, cy + tip + bob),
+                             (cx + half_w, cy + top)])
+
+    def _draw_sparkle_anim(self, surface, cx, cy, k):
+        s, inner, width, dot_r = k
+        cos, sin = math.cos, math.sin
+        line = pygame.draw.line
+        t2 = self.time * 2
+        t5 = self.time * 5
+        cos_t2, sin_t2 = cos(t2), sin(t2)
+        cos_t5, sin_t5 = cos(t5), sin(t5)
+        for dc, ds, pc, ps, col in _SPARKLE_RAYS:
+            # cos/sin(j * pi/4 + t2), sin(t5 + j)
+            ca = dc * cos_t2 - ds * sin_t2
+            sa = ds * cos_t2 + dc * sin_t2
+            length = int((20 + (sin_t5 * pc + cos_t5 * ps) * 7) * s)
+            line(surface, col,
+                 (cx + int(inner * ca), cy + int(inner * sa)),
+                 (cx + int(length * ca), cy + int(length * sa)), width)
+        pygame.draw.circle(surface, WHITE, (cx, cy), dot_r)
+
+    def _draw_cloud_anim(self, surface, cx, cy, k):
+        period, drops, drop_y, r = k
+        circle = pygame.draw.circle
+        fall = self.time * 40
+        y0 = cy + drop_y
+        for dx, phase in drops:
+            circle(surface, (100, 180, 255),
+                   (cx + dx, int(y0 + (fall + phase) % period)), r)
@@ -4,7 +4,7 @@ import pygame
 import random
 import math
 from config import WIDTH, HEIGHT, WHITE, BLACK
-from ui import draw_back_button, get_font, ScrollToolbar
+from ui import draw_back_button, get_font, make_vertical_gradient, ScrollToolbar
 
 
 # ---------------------------------------------------------------------------
@@ -16,8 +16,14 @@ TOOL_BUTTERFLY = 2
 TOOL_BEE = 3
 
 MAX_ITEMS = 30
+MAX_SPARKLES = 300  # 10 per planting, each lives under a second
+
+# Sparkle shade clamp: _SHADE_CLAMP[v + 30] == min(255, max(0, v)) for a
+# channel value jittered to v in -30..295
+_SHADE_CLAMP = tuple(min(255, max(0, v)) for v in range(-30, 296))
 
 GRASS_TOP = HEIGHT - 200  # y where grass starts
+SUN_X, SUN_Y = WIDTH - 80, 70  # sun center, top-right sky
 
 # Petal color palette
 PETAL_COLORS = [
@@ -57,6 +63,12 @@ class Flower:
         self.sway_phase = random.uniform(0, math.pi * 2)
         self.sway_speed = random.uniform(1.5, 2.5)
         self.petal_size = random.randint(10, 16)
+        # Petal directions are fixed: unit vectors (pre-scaled by the 0.7
+        # petal spread) so draw() only multiplies by the bloom radius
+        step = 2 * math.pi / self.num_petals
+        self._petal_unit = [(math.cos(step * i) * 0.7, math.sin(step * i) * 0.7)
+                            for i in range(self.num_petals)]
+        self._bloom = None  # full-bloom sprite, rendered once grown
 
     def update(self, dt, time):
         self.age += dt
@@ -92,15 +104,20 @@ class Flower:
                                     (leaf_x - 8, leaf_y - 3, 16, 7))
 
         # Bloom
-        if progress > 0.5:
+        if progress >= 1.0:
+            # Full bloom never changes shape: cached sprite, swaying with the tip
+            if self._bloom is None:
+                self._bloom = self._render_bloom()
+            sprite, dx, dy = self._bloom
+            surface.blit(sprite, (int(tip_x) + dx, int(tip_y) + dy))
+        elif progress > 0.5:
             bloom = (progress - 0.5) / 0.5  # 0..1 during bloom phase
             r = int(self.petal_size * bloom)
             cr = max(2, int(r * 0.45))
             if r > 1:
-                for i in range(self.num_petals):
-                    angle = (2 * math.pi / self.num_petals) * i
-                    px = int(tip_x + math.cos(angle) * r * 0.7)
-                    py = int(tip_y + math.sin(angle) * r * 0.7)
+                for ux, uy in self._petal_unit:
+                    px = int(tip_x + ux * r)
+                    py = int(tip_y + uy * r)
                     pygame.draw.circle(surface, self.petal_color, (px, py), r)
                 # Center
                 pygame.draw.circle(surface, self.center_color,
@@ -110,6 +127,19 @@ class Flower:
             pygame.draw.circle(surface, (100, 180, 70),
                                (int(tip_x), int(tip_y)), 3)
 
+    def _render_bloom(self):
+        """Rasterize the fully open petals and center, cropped, with the
+        crop's offset from the stem tip."""
+        r = self.petal_size
+        half = 2 * r
+        surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        for ux, uy in self._petal_unit:
+            pygame.draw.circle(surf, self.petal_color,
+                               (int(half + ux * r), int(half + uy * r)), r)
+        pygame.draw.circle(surf, self.center_color, (half, half), max(2, int(r * 0.45)))
+        used = surf.get_bounding_rect()
+        return surf.subsurface(used).copy(), used.x - half, used.y - half
+
 
 class Tree:
     """A tree that grows a trunk then expands a leafy crown."""
@@ -133,6 +163,7 @@ class Tree:
             min(255, self.leaf_color[1] + 40),
             min(255, self.leaf_color[2] + 40),
         )
+        self._crown = None  # full-size crown sprite, rendered once grown
 
     def update(self, dt, time):
         self.age += dt
@@ -166,7 +197,13 @@ class Tree:
                              (int(top_x), int(top_y)), 2)
 
         # Crown
-        if crown_progress > 0.0:
+        if crown_progress >= 1.0:
+            # Full-size crown never changes shape: cached sprite
+            if self._crown is None:
+                self._crown = self._render_crown()
+            sprite, dx, dy = self._crown
+            surface.blit(sprite, (int(top_x) + dx, int(top_y) + dy))
+        elif crown_progress > 0.0:
             cr = int(self.crown_radius * crown_progress)
             if cr > 2:
                 # Main crown
@@ -179,6 +216,20 @@ class Tree:
                     pygame.draw.circle(surface, self.leaf_highlight,
                                        (hx, hy), int(cr * 0.5))
 
+    def _render_crown(self):
+        """Rasterize the full-size crown, cropped, with the crop's offset
+        from the trunk top."""
+        cr = self.crown_radius
+        half = 2 * cr
+        surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surf, self.leaf_color, (half, int(half - cr * 0.3)), cr)
+        for dx, dy in [(-0.3, -0.4), (0.3, -0.5), (0, -0.7)]:
+            hx = int(half + cr * dx)
+            hy = int(half - cr * 0.3 + cr * dy)
+            pygame.draw.circle(surf, self.leaf_highlight, (hx, hy), int(cr * 0.5))
+        used = surf.get_bounding_rect()
+        return surf.subsurface(used).copy(), used.x - half, used.y - half
+
 
 class Butterfly:
     """A butterfly that flutters around near its spawn point."""
@@ -214,11 +265,15 @@ class Butterfly:
         self.y = self.home_y + math.sin(time * self.speed_y + self.phase_y) * self.range_y
 
     def draw(self, surface, time):
-        # Wing flap: scale from 0.2 to 1.0
-        flap = (math.sin(time * self.wing_speed) + 1) * 0.4 + 0.2
         s = self.size
         ix = int(self.x)
         iy = int(self.y)
+        # Flutter range reaches past the screen edge: skip when fully off
+        if not (-2 * s < ix < WIDTH + 2 * s and -2 * s < iy < HEIGHT + 2 * s):
+            return
+
+        # Wing flap: scale from 0.2 to 1.0
+        flap = (math.sin(time * self.wing_speed) + 1) * 0.4 + 0.2
 
         wing_w = int(s * flap)
 
@@ -263,6 +318,7 @@ class Bee:
         self.range_y = random.uniform(20, 40)
         self.size = random.randint(8, 12)
         self.wing_speed = random.uniform(12, 18)
+        self._body = self._render_body()
 
     def update(self, dt, time):
         self.age += dt
@@ -275,6 +331,9 @@ class Bee:
         ix = int(self.x)
         iy = int(self.y)
         s = self.size
+        # Figure-8 range reaches past the screen edge: skip when fully off
+        if not (-2 * s < ix < WIDTH + 2 * s and -2 * s < iy < HEIGHT + 2 * s):
+            return
 
         # Wings (flutter)
         wing_up = math.sin(time * self.wing_speed) * 3
@@ -286,56 +345,131 @@ class Bee:
         pygame.draw.ellipse(surface, wing_draw,
                             (ix - 1, iy - s + int(-wing_up), s, s - 2))
 
+        # Body, stripes, head and stinger never change: cached sprite
+        sprite, dx, dy = self._body
+        surface.blit(sprite, (ix + dx, iy + dy))
+
+    def _render_body(self):
+        """Rasterize the striped body, head and stinger, cropped, with the
+        crop's offset from the bee's center."""
+        s = self.size
+        half = s + 2
+        surf = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+        ix = iy = half
+
         # Body — yellow with black stripes
         body_rect = (ix - s // 2, iy - s // 3, s, int(s * 0.7))
-        pygame.draw.ellipse(surface, (255, 220, 50), body_rect)
+        pygame.draw.ellipse(surf, (255, 220, 50), body_rect)
         # Stripes
         stripe_w = max(1, s // 5)
         for sx in range(ix - s // 4, ix + s // 3, stripe_w * 2):
-            pygame.draw.line(surface, BLACK, (sx, iy - s // 4),
+            pygame.draw.line(surf, BLACK, (sx, iy - s // 4),
                              (sx, iy + s // 4), max(1, stripe_w // 2))
 
         # Head
-        pygame.draw.circle(surface, (50, 40, 10), (ix - s // 2, iy), max(2, s // 3))
+        pygame.draw.circle(surf, (50, 40, 10), (ix - s // 2, iy), max(2, s // 3))
         # Eyes
-        pygame.draw.circle(surface, WHITE, (ix - s // 2 - 1, iy - 1), max(1, s // 6))
+        pygame.draw.circle(surf, WHITE, (ix - s // 2 - 1, iy - 1), max(1, s // 6))
 
         # Stinger
-        pygame.draw.circle(surface, (40, 30, 10),
+        pygame.draw.circle(surf, (40, 30, 10),
                            (ix + s // 2 + 1, iy), max(1, s // 5))
 
+        used = surf.get_bounding_rect()
+        return surf.subsurface(used).copy(), used.x - half, used.y - half
+
 
 # ---------------------------------------------------------------------------
 # Sparkle particle for planting feedback
 # ---------------------------------------------------------------------------
 
-class Sparkle:
-    """Small sparkle that pops up when something is planted."""
-
-    def __init__(self, x, y, color):
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(60, 180)
-        self.x = float(x)
-        self.y = float(y)
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed - 60
-        self.color = color
-        self.life = random.uniform(0.4, 0.8)
-        self.max_life = self.life
-        self.radius = random.uniform(2, 5)
+class SparklePool:
+    """Flat list-of-lists pool of the sparkles that pop up when something is
+    planted.  No per-sparkle objects; dead sparkles are swap-removed."""
+
+    __slots__ = ("cap", "count", "x", "y", "vx", "vy",
+                 "color", "life", "max_life", "radius")
+
+    def __init__(self, capacity):
+        self.cap = capacity
+        self.count = 0
+        self.x = [0.0] * capacity
+        self.y = [0.0] * capacity
+        self.vx = [0.0] * capacity
+        self.vy = [0.0] * capacity
+        self.color = [WHITE] * capacity
+        self.life = [0.0] * capacity
+        self.max_life = [1.0] * capacity
+        self.radius = [1.0] * capacity
+
+    def clear(self):
+        self.count = 0
+
+    def burst(self, px, py, colors):
+        """Add one sparkle per color, all bursting out of (px, py) in random
+        directions.  Sparkles that don't fit in the pool are dropped."""
+        n = self.count
+        end = min(self.cap, n + len(colors))
+        rand = random.random
+        cos, sin = math.cos, math.sin
+        px = float(px)
+        py = float(py)
+        for i, color in zip(range(n, end), colors):
+            # Same ranges as uniform(0, 2pi), (60, 180), (0.4, 0.8), (2, 5)
+            angle = rand() * (2 * math.pi)
+            speed = 60 + 120 * rand()
+            self.x[i] = px
+            self.y[i] = py
+            self.vx[i] = cos(angle) * speed
+            self.vy[i] = sin(angle) * speed - 60
+            self.color[i] = color
+            self.life[i] = self.max_life[i] = 0.4 + 0.4 * rand()
+            self.radius[i] = 2 + 3 * rand()
+        self.count = end
 
     def update(self, dt):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.vy += 120 * dt
-        self.life -= dt
+        n = self.count
+        x = self.x; y = self.y
+        vx = self.vx; vy = self.vy
+        life = self.life
+        grav_dt = 120 * dt
+
+        i = 0
+        while i < n:
+            life[i] -= dt
+            if life[i] <= 0.0:
+                # Swap-remove
+                n -= 1
+                x[i] = x[n]; y[i] = y[n]
+                vx[i] = vx[n]; vy[i] = vy[n]
+                self.color[i] = self.color[n]
+                life[i] = life[n]
+                self.max_life[i] = self.max_life[n]
+                self.radius[i] = self.radius[n]
+                continue
+            x[i] += vx[i] * dt
+            y[i] += vy[i] * dt
+            vy[i] += grav_dt
+            i += 1
+        self.count = n
 
     def draw(self, surface):
-        if self.life > 0:
-            alpha = self.life / self.max_life
-            r = max(1, int(self.radius * alpha))
-            pygame.draw.circle(surface, self.color,
-                               (int(self.x), int(self.y)), r)
+        """Draw the sparkles, shrinking as they fade, in one locked pass."""
+        n = self.count
+        if not n:
+            return
+        x = self.x; y = self.y
+        color = self.color
+        life = self.life; max_life = self.max_life
+        radius = self.radius
+        circle = pygame.draw.circle
+        surface.lock()
+        try:
+            for i in range(n):
+                r = max(1, int(radius[i] * (life[i] / max_life[i])))
+                circle(surface, color[i], (int(x[i]), int(y[i])), r)
+        finally:
+            surface.unlock()
 
 
 # ---------------------------------------------------------------------------
@@ -353,51 +487,128 @@ class MagicGardenScreen:
 
     def __init__(self, app):
         self.app = app
-        self.items = []
-        self.sparkles = []
+        # Flowers/trees draw before butterflies/bees; kept apart from the
+        # start so draw() needn't partition them
+        self.ground_items = []
+        self.flying_items = []
+        self.sparkles = SparklePool(MAX_SPARKLES)
         self.selected_tool = TOOL_FLOWER
         self.time = 0.0
         self.back_rect = None
-        self.tool_rects = []
-        self.clear_rect = None
         self.bg_surface = None
 
+        # Tool buttons along top
+        btn_w, btn_h = 120, 62
+        start_x = 110
+        btn_y = 10
+        self.tool_rects = [pygame.Rect(start_x + i * (btn_w + 10), btn_y, btn_w, btn_h)
+                           for i in range(len(TOOL_DEFS))]
+        self.tool_surfs = [self._build_tool_button(i, btn_w, btn_h)
+                           for i in range(len(TOOL_DEFS))]
+
+        # Clear button (top right), pre-rendered
+        clear_w, clear_h = 80, 50
+        self.clear_rect = pygame.Rect(WIDTH - clear_w - 12, 16, clear_w, clear_h)
+        self.clear_surf = pygame.Surface((clear_w, clear_h), pygame.SRCALPHA)
+        local = self.clear_surf.get_rect()
+        pygame.draw.rect(self.clear_surf, (200, 70, 70), local, border_radius=10)
+        pygame.draw.rect(self.clear_surf, (160, 50, 50), local, width=2, border_radius=10)
+        txt = get_font(20).render("Clear", True, WHITE)
+        self.clear_surf.blit(txt, txt.get_rect(center=local.center))
+
+        # Shown when the item count hits MAX_ITEMS
+        self.full_surf = get_font(22).render("Garden Full!", True, (200, 60, 60))
+        self.full_rect = self.full_surf.get_rect(center=(WIDTH // 2, 80))
+
     def _build_bg(self):
-        """Pre-render background gradient: sky + grass."""
+        """Pre-render the static background: sky + grass gradients, grass
+        blades, the horizon line and the sun."""
         surf = pygame.Surface((WIDTH, HEIGHT))
-        # Sky
-        for y in range(GRASS_TOP):
-            t = y / max(1, GRASS_TOP)
-            r = int(self.SKY_TOP[0] + (self.SKY_BOTTOM[0] - self.SKY_TOP[0]) * t)
-            g = int(self.SKY_TOP[1] + (self.SKY_BOTTOM[1] - self.SKY_TOP[1]) * t)
-            b = int(self.SKY_TOP[2] + (self.SKY_BOTTOM[2] - self.SKY_TOP[2]) * t)
-            pygame.draw.line(surf, (r, g, b), (0, y), (WIDTH, y))
-        # Grass
-        grass_h = HEIGHT - GRASS_TOP
-        for y in range(grass_h):
-            t = y / max(1, grass_h)
-            r = int(self.GRASS_TOP_COLOR[0] + (self.GRASS_BOTTOM_COLOR[0] - self.GRASS_TOP_COLOR[0]) * t)
-            g = int(self.GRASS_TOP_COLOR[1] + (self.GRASS_BOTTOM_COLOR[1] - self.GRASS_TOP_COLOR[1]) * t)
-            b = int(self.GRASS_TOP_COLOR[2] + (self.GRASS_BOTTOM_COLOR[2] - self.GRASS_TOP_COLOR[2]) * t)
-            pygame.draw.line(surf, (r, g, b), (0, GRASS_TOP + y), (WIDTH, GRASS_TOP + y))
+        surf.blit(make_vertical_gradient(WIDTH, GRASS_TOP,
+                                         self.SKY_TOP, self.SKY_BOTTOM), (0, 0))
+        surf.blit(make_vertical_gradient(WIDTH, HEIGHT - GRASS_TOP,
+                                         self.GRASS_TOP_COLOR, self.GRASS_BOTTOM_COLOR),
+                  (0, GRASS_TOP))
+
+        # Grass texture — a few darker blades scattered, from a fixed seed
+        rng = random.Random(42)
+        for _ in range(60):
+            gx = rng.randint(0, WIDTH)
+            gy = rng.randint(GRASS_TOP, HEIGHT)
+            blade_h = rng.randint(5, 15)
+            shade = rng.randint(0, 40)
+            color = (60 - shade, 140 + rng.randint(0, 30), 50 - shade)
+            color = tuple(max(0, min(255, c)) for c in color)
+            pygame.draw.line(surf, color, (gx, gy), (gx + rng.randint(-3, 3), gy - blade_h), 1)
+
+        # Horizon line (soft)
+        pygame.draw.line(surf, (80, 180, 60), (0, GRASS_TOP), (WIDTH, GRASS_TOP), 2)
+
+        # Sun — soft halo rings brightening toward the center, then the
+        # core. Nothing static is drawn over the sky, so it goes straight on.
+        for r in range(50, 20, -5):
+            alpha = 40 + (50 - r) * 3
+            sun_surf = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
+            pygame.draw.circle(sun_surf, (255, 240, 100, alpha), (r, r), r)
+            surf.blit(sun_surf, (SUN_X - r, SUN_Y - r))
+        pygame.draw.circle(surf, (255, 240, 130), (SUN_X, SUN_Y), 22)
+        return surf
+
+    def _build_tool_button(self, i, btn_w, btn_h):
+        """Pre-render tool button i unselected: fill, border, icon, label."""
+        label, fill, icon_col = TOOL_DEFS[i]
+        surf = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
+        rect = surf.get_rect()
+        # Button bg
+        pygame.draw.rect(surf, fill, rect, border_radius=10)
+        # Border (the selected button gets a white one drawn over it)
+        pygame.draw.rect(surf, (60, 60, 60), rect, width=2, border_radius=10)
+
+        # Icon hint — small shape in the button
+        cx, cy = rect.centerx, rect.centery - 4
+        if i == TOOL_FLOWER:
+            for a in range(5):
+                angle = (2 * math.pi / 5) * a
+                px = int(cx + math.cos(angle) * 8)
+                py = int(cy + math.sin(angle) * 8)
+                pygame.draw.circle(surf, icon_col, (px, py), 5)
+            pygame.draw.circle(surf, (255, 230, 80), (cx, cy), 4)
+        elif i == TOOL_TREE:
+            pygame.draw.rect(surf, fill, (cx - 3, cy + 2, 6, 10))
+            pygame.draw.circle(surf, icon_col, (cx, cy - 4), 10)
+        elif i == TOOL_BUTTERFLY:
+            pygame.draw.ellipse(surf, icon_col, (cx - 10, cy - 6, 9, 12))
+            pygame.draw.ellipse(surf, icon_col, (cx + 1, cy - 6, 9, 12))
+            pygame.draw.rect(surf, (60, 40, 80), (cx - 1, cy - 5, 2, 10))
+        elif i == TOOL_BEE:
+            pygame.draw.ellipse(surf, (255, 220, 50), (cx - 7, cy - 5, 14, 10))
+            pygame.draw.line(surf, BLACK, (cx - 3, cy - 5), (cx - 3, cy + 5), 1)
+            pygame.draw.line(surf, BLACK, (cx + 2, cy - 5), (cx + 2, cy + 5), 1)
+
+        # Label below icon
+        txt = get_font(18).render(label, True, WHITE)
+        surf.blit(txt, txt.get_rect(centerx=rect.centerx, bottom=rect.bottom - 2))
         return surf
 
     def on_enter(self):
-        self.items = []
-        self.sparkles = []
+        self.ground_items = []
+        self.flying_items = []
+        self.sparkles.clear()
         self.selected_tool = TOOL_FLOWER
         self.time = 0.0
         if self.bg_surface is None:
             self.bg_surface = self._build_bg()
 
     def _spawn_sparkles(self, x, y, color):
-        for _ in range(10):
-            shade = (
-                min(255, max(0, color[0] + random.randint(-30, 40))),
-                min(255, max(0, color[1] + random.randint(-30, 40))),
-                min(255, max(0, color[2] + random.randint(-30, 40))),
-            )
-            self.sparkles.append(Sparkle(x, y, shade))
+        # Each channel jitters by -30..+40; randint(0, 70) indexes the
+        # clamp table from 30 below the channel value
+        randint = random.randint
+        r, g, b = color
+        self.sparkles.burst(x, y, [
+            (_SHADE_CLAMP[r + randint(0, 70)],
+             _SHADE_CLAMP[g + randint(0, 70)],
+             _SHADE_CLAMP[b + randint(0, 70)])
+            for _ in range(10)])
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -409,9 +620,10 @@ class MagicGardenScreen:
                 return
 
             # Clear button
-            if self.clear_rect and self.clear_rect.collidepoint(pos):
-                self.items = []
-                self.sparkles = []
+            if self.clear_rect.collidepoint(pos):
+                self.ground_items = []
+                self.flying_items = []
+                self.sparkles.clear()
                 return
 
             # Tool buttons
@@ -421,7 +633,7 @@ class MagicGardenScreen:
                     return
 
             # Plant on grass area (below tool bar, on or above the grass)
-            if pos[1] > 90 and len(self.items) < MAX_ITEMS:
+            if pos[1] > 90 and len(self.ground_items) + len(self.flying_items) < MAX_ITEMS:
                 x, y = pos
                 # Clamp planting to grass region for ground items, allow
                 # butterflies/bees in the sky too
@@ -429,27 +641,28 @@ class MagicGardenScreen:
                     y = max(GRASS_TOP + 10, y)
                     item = Flower(x, y)
                     self._spawn_sparkles(x, y, item.petal_color)
+                    self.ground_items.append(item)
                 elif self.selected_tool == TOOL_TREE:
                     y = max(GRASS_TOP + 20, y)
                     item = Tree(x, y)
                     self._spawn_sparkles(x, y, (100, 200, 80))
+                    self.ground_items.append(item)
                 elif self.selected_tool == TOOL_BUTTERFLY:
                     item = Butterfly(x, y)
                     self._spawn_sparkles(x, y, item.wing_color)
+                    self.flying_items.append(item)
                 elif self.selected_tool == TOOL_BEE:
                     item = Bee(x, y)
                     self._spawn_sparkles(x, y, (255, 220, 60))
-                else:
-                    return
-                self.items.append(item)
+                    self.flying_items.append(item)
 
     def update(self, dt):
         self.time += dt
-        for item in self.items:
+        for item in self.ground_items:
+            item.update(dt, self.time)
+        for item in self.flying_items:
             item.update(dt, self.time)
-        for s in self.sparkles:
-            s.update(dt)
-        self.sparkles = [s for s in self.sparkles if s.life > 0]
+        self.sparkles.update(dt)
 
     def draw(self, surface):
         # Background
@@ -457,109 +670,34 @@ class MagicGardenScreen:
             self.bg_surface = self._build_bg()
         surface.blit(self.bg_surface, (0, 0))
 
-        # Grass texture — a few darker blades scattered
-        random.seed(42)  # deterministic so it doesn't flicker
-        for _ in range(60):
-            gx = random.randint(0, WIDTH)
-            gy = random.randint(GRASS_TOP, HEIGHT)
-            blade_h = random.randint(5, 15)
-            shade = random.randint(0, 40)
-            color = (60 - shade, 140 + random.randint(0, 30), 50 - shade)
-            color = tuple(max(0, min(255, c)) for c in color)
-            pygame.draw.line(surface, color, (gx, gy), (gx + random.randint(-3, 3), gy - blade_h), 1)
-        random.seed()  # restore randomness
-
-        # Horizon line (soft)
-        pygame.draw.line(surface, (80, 180, 60), (0, GRASS_TOP), (WIDTH, GRASS_TOP), 2)
-
-        # Sun in top-right sky
-        sun_x, sun_y = WIDTH - 80, 70
-        for r in range(50, 20, -5):
-            alpha = 40 + (50 - r) * 3
-            sun_surf = pygame.Surface((r * 2, r * 2), pygame.SRCALPHA)
-            pygame.draw.circle(sun_surf, (255, 240, 100, alpha), (r, r), r)
-            surface.blit(sun_surf, (sun_x - r, sun_y - r))
-        pygame.draw.circle(surface, (255, 240, 130), (sun_x, sun_y), 22)
-
         # Garden items — draw ground items (flowers, trees) first, then flying
-        ground = [it for it in self.items if isinstance(it, (Flower, Tree))]
-        flying = [it for it in self.items if isinstance(it, (Butterfly, Bee))]
-        for item in ground:
+        for item in self.ground_items:
             item.draw(surface, self.time)
-        for item in flying:
+        for item in self.flying_items:
             item.draw(surface, self.time)
 
         # Sparkles
-        for s in self.sparkles:
-            s.draw(surface)
+        self.sparkles.draw(surface)
 
         # --- UI overlay ---
 
         # Back button
         self.back_rect = draw_back_button(surface)
 
-        # Tool buttons along top
-        self.tool_rects = []
-        btn_w, btn_h = 120, 62
-        start_x = 110
-        btn_y = 10
-        font = get_font(18)
-
-        for i, (label, fill, icon_col) in enumerate(TOOL_DEFS):
-            x = start_x + i * (btn_w + 10)
-            rect = pygame.Rect(x, btn_y, btn_w, btn_h)
-            self.tool_rects.append(rect)
-
-            # Selected highlight
+        # Tool buttons along top — only the selection highlight changes
+        for i, rect in enumerate(self.tool_rects):
             if i == self.selected_tool:
                 # Glow behind
                 pygame.draw.rect(surface, WHITE,
                                  rect.inflate(6, 6), border_radius=14)
-            # Button bg
-            pygame.draw.rect(surface, fill, rect, border_radius=10)
-            # Border
-            border_col = WHITE if i == self.selected_tool else (0, 0, 0, 80)
-            pygame.draw.rect(surface, (60, 60, 60) if i != self.selected_tool else WHITE,
-                             rect, width=2, border_radius=10)
-
-            # Icon hint — small shape in the button
-            cx, cy = rect.centerx, rect.centery - 4
-            if i == TOOL_FLOWER:
-                for a in range(5):
-                    angle = (2 * math.pi / 5) * a
-                    px = int(cx + math.cos(angle) * 8)
-                    py = int(cy + math.sin(angle) * 8)
-                    pygame.draw.circle(surface, icon_col, (px, py), 5)
-                pygame.draw.circle(surface, (255, 230, 80), (cx, cy), 4)
-            elif i == TOOL_TREE:
-                pygame.draw.rect(surface, fill, (cx - 3, cy + 2, 6, 10))
-                pygame.draw.circle(surface, icon_col, (cx, cy - 4), 10)
-            elif i == TOOL_BUTTERFLY:
-                pygame.draw.ellipse(surface, icon_col, (cx - 10, cy - 6, 9, 12))
-                pygame.draw.ellipse(surface, icon_col, (cx + 1, cy - 6, 9, 12))
-                pygame.draw.rect(surface, (60, 40, 80), (cx - 1, cy - 5, 2, 10))
-            elif i == TOOL_BEE:
-                pygame.draw.ellipse(surface, (255, 220, 50), (cx - 7, cy - 5, 14, 10))
-                pygame.draw.line(surface, BLACK, (cx - 3, cy - 5), (cx - 3, cy + 5), 1)
-                pygame.draw.line(surface, BLACK, (cx + 2, cy - 5), (cx + 2, cy + 5), 1)
-
-            # Label below icon
-            txt = font.render(label, True, WHITE)
-            surface.blit(txt, txt.get_rect(centerx=rect.centerx, bottom=rect.bottom - 2))
+                surface.blit(self.tool_surfs[i], rect)
+                pygame.draw.rect(surface, WHITE, rect, width=2, border_radius=10)
+            else:
+                surface.blit(self.tool_surfs[i], rect)
 
         # Clear button (top right)
-        clear_font = get_font(20)
-        clear_w, clear_h = 80, 50
-        clear_x = WIDTH - clear_w - 12
-        clear_y = 16
-        self.clear_rect = pygame.Rect(clear_x, clear_y, clear_w, clear_h)
-        pygame.draw.rect(surface, (200, 70, 70), self.clear_rect, border_radius=10)
-        pygame.draw.rect(surface, (160, 50, 50), self.clear_rect, width=2, border_radius=10)
-        txt = clear_font.render("Clear", True, WHITE)
-        surface.blit(txt, txt.get_rect(center=self.clear_rect.center))
+        surface.blit(self.clear_surf, self.clear_rect)
 
         # Item count indicator (so the user knows when garden is full)
-        if len(self.items) >= MAX_ITEMS:
-            full_font = get_font(22)
-            full_txt = full_font.render("Garden Full!", True, (200, 60, 60))
-            surface.blit(full_txt, full_txt.get_rect(center=(WIDTH // 2, 80)))
+        if len(self.ground_items) + len(self.flying_items) >= MAX_ITEMS:
+            surface.blit(self.full_surf, self.full_rect)
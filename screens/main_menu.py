@@ -1,5 +1,6 @@
 # screens/main_menu.py — Magical animated main menu for Ava's Game Box
 
+import heapq
 import math
 import random
 import pygame
@@ -10,6 +11,9 @@ from ui import draw_3d_button, get_font, PressTracker, hsv_to_rgb
 
 PURPLE = (156, 39, 176)
 
+LAVA_SCALE = 4  # lava-lamp background is composed at 1/4 size, then upscaled
+LAVA_REFRESH_FRAMES = 6  # blobs drift and shift hue slowly; no need to redo every frame
+
 # ---------- Lava-lamp gradient background ----------
 
 class LavaBlob:
@@ -39,144 +43,309 @@ class LavaBlob:
 
 # ---------- Floating decorative shapes ----------
 
-class FloatingShape:
-    """A star, heart, sparkle, or bubble drifting across the screen."""
-    SHAPES = ["star", "heart", "sparkle", "bubble"]
-
-    def __init__(self):
-        self.reset(random_pos=True)
-
-    def reset(self, random_pos=False):
+SHAPE_COLORS = [
+    (255, 200, 220), (200, 220, 255), (255, 255, 180),
+    (220, 200, 255), (180, 255, 220), (255, 180, 200),
+    (255, 220, 150), (180, 230, 255), (255, 190, 255),
+]
+SHAPE_KINDS = ["star", "heart", "sparkle", "bubble"]
+# Rotational symmetry period of the spinning shapes (radians)
+SPIN_PERIODS = {"star": 2 * math.pi / 5, "sparkle": math.pi / 2}
+SPIN_FRAMES = 32  # pre-rotated frames per spinning shape
+
+
+def _render_shape(kind, size, color, alpha, angle_off):
+    """Rasterize one shape rotated by angle_off, cropped to its pixels.
+    Returns (surface, dx, dy), the crop's offset from the shape center."""
+    s = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
+    cx, cy = size * 2, size * 2
+    rgba = (*color, alpha)
+
+    if kind == "star":
+        points = []
+        for i in range(5):
+            angle = i * (2 * math.pi / 5) - math.pi / 2 + angle_off
+            outer = size
+            inner = size * 0.4
+            points.append((cx + int(outer * math.cos(angle)),
+                          cy + int(outer * math.sin(angle))))
+            angle2 = angle + math.pi / 5
+            points.append((cx + int(inner * math.cos(angle2)),
+                          cy + int(inner * math.sin(angle2))))
+        pygame.draw.polygon(s, rgba, points)
+    elif kind == "heart":
+        r = size // 2
+        pygame.draw.circle(s, rgba, (cx - r // 2, cy - r // 3), r)
+        pygame.draw.circle(s, rgba, (cx + r // 2, cy - r // 3), r)
+        pygame.draw.polygon(s, rgba, [
+            (cx - size + 2, cy - 2),
+            (cx + size - 2, cy - 2),
+            (cx, cy + size)
+        ])
+    elif kind == "sparkle":
+        # Four-pointed sparkle
+        arm = size
+        thin = max(2, size // 4)
+        for a in range(4):
+            ang = a * math.pi / 2 + angle_off
+            ex = cx + int(arm * math.cos(ang))
+            ey = cy + int(arm * math.sin(ang))
+            perp = ang + math.pi / 2
+            px, py = int(thin * math.cos(perp)), int(thin * math.sin(perp))
+            pts = [(cx + px, cy + py), (ex, ey), (cx - px, cy - py)]
+            pygame.draw.polygon(s, rgba, pts)
+    else:  # bubble
+        pygame.draw.circle(s, (*color, alpha // 2), (cx, cy), size)
+        pygame.draw.circle(s, rgba, (cx, cy), size, 1)
+        # Tiny highlight
+        pygame.draw.circle(s, (255, 255, 255, min(200, alpha + 60)),
+                         (cx - size // 3, cy - size // 3),
+                         max(1, size // 4))
+
+    used = s.get_bounding_rect()
+    return s.subsurface(used).copy(), used.x - cx, used.y - cy
+
+
+class FloatingShapes:
+    """Stars, hearts, sparkles and bubbles drifting across the screen.
+    Struct-of-arrays: one list per field, one loop per frame for all."""
+
+    __slots__ = ("count", "x", "y", "base_vx", "base_vy",
+                 "scatter_vx", "scatter_vy", "phase", "spin",
+                 "look", "frames", "frame_scale", "blit_list")
+
+    def __init__(self, count):
+        self.count = count
+        self.x = [0.0] * count
+        self.y = [0.0] * count
+        self.base_vx = [0.0] * count
+        self.base_vy = [0.0] * count
+        self.scatter_vx = [0.0] * count
+        self.scatter_vy = [0.0] * count
+        self.phase = [0.0] * count
+        self.spin = [1.0] * count
+        # (kind, size, color, alpha) per shape, and its rendered frames:
+        # one for hearts and bubbles, SPIN_FRAMES (rendered lazily) over
+        # the symmetry period for stars and sparkles
+        self.look = [None] * count
+        self.frames = [None] * count
+        self.frame_scale = [0.0] * count
+        self.blit_list = []  # reused by draw() every frame
+        for i in range(count):
+            self._reset(i, random_pos=True)
+
+    def _reset(self, i, random_pos=False):
         if random_pos:
-            self.x = random.uniform(0, WIDTH)
-            self.y = random.uniform(0, HEIGHT)
+            self.x[i] = random.uniform(0, WIDTH)
+            self.y[i] = random.uniform(0, HEIGHT)
         else:
-            self.x = random.uniform(-40, -10)
-            self.y = random.uniform(30, HEIGHT - 30)
-        self.base_vx = random.uniform(12, 35)
-        self.base_vy = random.uniform(-6, 6)
-        self.vx = self.base_vx
-        self.vy = self.base_vy
-        self.size = random.randint(7, 16)
-        self.phase = random.uniform(0, math.pi * 2)
-        self.spin = random.uniform(0.5, 2.0)
-        self.alpha = random.randint(50, 120)
-        self.color = random.choice([
-            (255, 200, 220), (200, 220, 255), (255, 255, 180),
-            (220, 200, 255), (180, 255, 220), (255, 180, 200),
-            (255, 220, 150), (180, 230, 255), (255, 190, 255),
-        ])
-        self.shape = random.choice(self.SHAPES)
-        self.scatter_vx = 0.0
-        self.scatter_vy = 0.0
+            self.x[i] = random.uniform(-40, -10)
+            self.y[i] = random.uniform(30, HEIGHT - 30)
+        self.base_vx[i] = random.uniform(12, 35)
+        self.base_vy[i] = random.uniform(-6, 6)
+        size = random.randint(7, 16)
+        self.phase[i] = random.uniform(0, math.pi * 2)
+        self.spin[i] = random.uniform(0.5, 2.0)
+        alpha = random.randint(50, 120)
+        color = random.choice(SHAPE_COLORS)
+        kind = random.choice(SHAPE_KINDS)
+        self.scatter_vx[i] = 0.0
+        self.scatter_vy[i] = 0.0
+        self.look[i] = (kind, size, color, alpha)
+        if kind in SPIN_PERIODS:
+            self.frames[i] = [None] * SPIN_FRAMES
+            self.frame_scale[i] = SPIN_FRAMES / SPIN_PERIODS[kind]
+        else:
+            self.frames[i] = [_render_shape(kind, size, color, alpha, 0.0)]
+            self.frame_scale[i] = 0.0
 
     def scatter_from(self, tx, ty):
-        """Push this shape away from a tap point."""
-        dx = self.x - tx
-        dy = self.y - ty
-        dist = max(1, math.sqrt(dx * dx + dy * dy))
-        if dist < 200:
-            force = (200 - dist) * 2.5
-            self.scatter_vx = (dx / dist) * force
-            self.scatter_vy = (dy / dist) * force
+        """Push every shape within 200px away from a tap point."""
+        x = self.x; y = self.y
+        for i in range(self.count):
+            dx = x[i] - tx
+            dy = y[i] - ty
+            d2 = dx * dx + dy * dy
+            if d2 >= 40000:  # 200px squared; skip the sqrt for far shapes
+                continue
+            dist = max(1, math.sqrt(d2))
+            inv = (200 - dist) * 2.5 / dist
+            self.scatter_vx[i] = dx * inv
+            self.scatter_vy[i] = dy * inv
 
     def update(self, dt, time):
-        # Decay scatter velocity
-        self.scatter_vx *= 0.93
-        self.scatter_vy *= 0.93
-        self.vx = self.base_vx + self.scatter_vx
-        self.vy = self.base_vy + self.scatter_vy
-        self.x += self.vx * dt
-        self.y += self.vy * dt + math.sin(time * self.spin + self.phase) * 0.4
-        if self.x > WIDTH + 40 or self.x < -60 or self.y < -60 or self.y > HEIGHT + 60:
-            self.reset(random_pos=False)
+        x = self.x; y = self.y
+        base_vx = self.base_vx; base_vy = self.base_vy
+        svx = self.scatter_vx; svy = self.scatter_vy
+        phase = self.phase; spin = self.spin
+        sin = math.sin
+        for i in range(self.count):
+            # Decay scatter velocity
+            svx[i] *= 0.93
+            svy[i] *= 0.93
+            x[i] += (base_vx[i] + svx[i]) * dt
+            y[i] += (base_vy[i] + svy[i]) * dt + sin(time * spin[i] + phase[i]) * 0.4
+            xi = x[i]; yi = y[i]
+            if xi > WIDTH + 40 or xi < -60 or yi < -60 or yi > HEIGHT + 60:
+                self._reset(i)
 
     def draw(self, surface, time):
-        s = pygame.Surface((self.size * 4, self.size * 4), pygame.SRCALPHA)
-        cx, cy = self.size * 2, self.size * 2
-        color = (*self.color, self.alpha)
-
-        if self.shape == "star":
-            points = []
-            for i in range(5):
-                angle = i * (2 * math.pi / 5) - math.pi / 2 + time * self.spin
-                outer = self.size
-                inner = self.size * 0.4
-                points.append((cx + int(outer * math.cos(angle)),
-                              cy + int(outer * math.sin(angle))))
-                angle2 = angle + math.pi / 5
-                points.append((cx + int(inner * math.cos(angle2)),
-                              cy + int(inner * math.sin(angle2))))
-            pygame.draw.polygon(s, color, points)
-        elif self.shape == "heart":
-            r = self.size // 2
-            pygame.draw.circle(s, color, (cx - r // 2, cy - r // 3), r)
-            pygame.draw.circle(s, color, (cx + r // 2, cy - r // 3), r)
-            pygame.draw.polygon(s, color, [
-                (cx - self.size + 2, cy - 2),
-                (cx + self.size - 2, cy - 2),
-                (cx, cy + self.size)
-            ])
-        elif self.shape == "sparkle":
-            # Four-pointed sparkle
-            arm = self.size
-            thin = max(2, self.size // 4)
-            angle_off = time * self.spin
-            for a in range(4):
-                ang = a * math.pi / 2 + angle_off
-                ex = cx + int(arm * math.cos(ang))
-                ey = cy + int(arm * math.sin(ang))
-                perp = ang + math.pi / 2
-                px, py = int(thin * math.cos(perp)), int(thin * math.sin(perp))
-                pts = [(cx + px, cy + py), (ex, ey), (cx - px, cy - py)]
-                pygame.draw.polygon(s, color, pts)
-        else:  # bubble
-            pygame.draw.circle(s, (*self.color, self.alpha // 2), (cx, cy), self.size)
-            pygame.draw.circle(s, (*self.color, self.alpha), (cx, cy), self.size, 1)
-            # Tiny highlight
-            pygame.draw.circle(s, (255, 255, 255, min(200, self.alpha + 60)),
-                             (cx - self.size // 3, cy - self.size // 3),
-                             max(1, self.size // 4))
-
-        surface.blit(s, (int(self.x) - self.size * 2, int(self.y) - self.size * 2))
+        """Blit every shape's current frame in one blits() call."""
+        x = self.x; y = self.y
+        spin = self.spin; frame_scale = self.frame_scale
+        blit_list = self.blit_list
+        blit_list.clear()
+        for i in range(self.count):
+            frames = self.frames[i]
+            # Static shapes have frame_scale 0, so always land on frame 0
+            k = int(time * spin[i] * frame_scale[i]) % len(frames)
+            frame = frames[k]
+            if frame is None:
+                kind, size, color, alpha = self.look[i]
+                frame = frames[k] = _render_shape(kind, size, color, alpha,
+                                                  k / frame_scale[i])
+            sprite, dx, dy = frame
+            blit_list.append((sprite, (int(x[i]) + dx, int(y[i]) + dy)))
+        surface.blits(blit_list, doreturn=False)
+
+
+# ---------- Fading dot sprites ----------
+
+# Letter particles and trail dots are alpha circles that fade with life.
+# Life is rounded up to FADE_STEPS levels so the (color, radius, alpha)
+# combinations stay few and each sprite is rendered once, then shared.
+FADE_STEPS = 16
+_DOT_CACHE = {}
+
+
+def _fade_level(life):
+    """life (0..1] rounded up to the next 1/FADE_STEPS step."""
+    return min(FADE_STEPS, int(life * FADE_STEPS) + 1) / FADE_STEPS
+
+
+def _dot_sprite(color, radius, alpha):
+    """Shared SRCALPHA circle of the given color, radius and alpha."""
+    key = (color, radius, alpha)
+    sprite = _DOT_CACHE.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+        _DOT_CACHE[key] = sprite
+    return sprite
+
+
+def _draw_dots(surface, dots, blit_list):
+    """Blit every dot's sprite in one blits() call, reusing blit_list."""
+    blit_list.clear()
+    for dot in dots:
+        blit_list.append(dot.blit_item())
+    surface.blits(blit_list, doreturn=False)
 
 
 # ---------- Letter particle effects ----------
 
-class LetterParticle:
-    """Small particle that flies outward and fades when a letter is tapped."""
-    def __init__(self, x, y, color):
-        angle = random.uniform(0, math.pi * 2)
-        speed = random.uniform(100, 300)
-        self.x = x
-        self.y = y
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
-        self.life = 1.0
-        self.decay = random.uniform(1.5, 2.5)
-        self.size = random.randint(3, 7)
-        self.color = color
+def _advance(items, dt):
+    """Update each item, dropping those whose update() returns False.
+    Compacts the list in place rather than building a new one per frame."""
+    n = 0
+    for item in items:
+        if item.update(dt):
+            items[n] = item
+            n += 1
+    del items[n:]
+
+
+class LetterParticles:
+    """Pool of the small particles that fly outward and fade when a letter
+    is tapped. Struct-of-arrays shared by all letters, with swap-remove."""
+
+    __slots__ = ("cap", "count", "x", "y", "vx", "vy",
+                 "life", "decay", "size", "color", "blit_list")
+
+    def __init__(self, capacity):
+        self.cap = capacity
+        self.count = 0
+        self.x = [0.0] * capacity
+        self.y = [0.0] * capacity
+        self.vx = [0.0] * capacity
+        self.vy = [0.0] * capacity
+        self.life = [0.0] * capacity
+        self.decay = [1.0] * capacity
+        self.size = [3] * capacity
+        self.color = [WHITE] * capacity
+        self.blit_list = []  # reused by draw() every frame
+
+    def clear(self):
+        self.count = 0
+
+    def burst(self, px, py, colors, n=18):
+        """Spawn n particles at (px, py) flying in random directions.
+        If the pool is full, the particles closest to fading out (lowest
+        life) are recycled so a fresh tap always shows its burst."""
+        n = min(n, self.cap)
+        free = min(n, self.cap - self.count)
+        slots = list(range(self.count, self.count + free))
+        if free < n:
+            slots += heapq.nsmallest(n - free, range(self.count),
+                                     key=self.life.__getitem__)
+        self.count += free
+        for i in slots:
+            angle = random.uniform(0, math.pi * 2)
+            speed = random.uniform(100, 300)
+            self.x[i] = px
+            self.y[i] = py
+            self.vx[i] = math.cos(angle) * speed
+            self.vy[i] = math.sin(angle) * speed
+            self.life[i] = 1.0
+            self.decay[i] = random.uniform(1.5, 2.5)
+            self.size[i] = random.randint(3, 7)
+            self.color[i] = random.choice(colors)
 
     def update(self, dt):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.vx *= 0.96
-        self.vy *= 0.96
-        self.vy += 80 * dt  # gentle gravity
-        self.life -= self.decay * dt
-        return self.life > 0
+        n = self.count
+        x = self.x; y = self.y
+        vx = self.vx; vy = self.vy
+        life = self.life; decay = self.decay
+        grav_dt = 80 * dt  # gentle gravity
+
+        i = 0
+        while i < n:
+            life[i] -= decay[i] * dt
+            if life[i] <= 0.0:
+                # Swap-remove
+                n -= 1
+                x[i] = x[n]; y[i] = y[n]
+                vx[i] = vx[n]; vy[i] = vy[n]
+                life[i] = life[n]; decay[i] = decay[n]
+                self.size[i] = self.size[n]
+                self.color[i] = self.color[n]
+                continue
+            x[i] += vx[i] * dt
+            y[i] += vy[i] * dt
+            vx[i] *= 0.96
+            vy[i] = vy[i] * 0.96 + grav_dt
+            i += 1
+        self.count = n
 
     def draw(self, surface):
-        alpha = max(0, min(255, int(self.life * 255)))
-        s = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*self.color, alpha), (self.size, self.size), self.size)
-        surface.blit(s, (int(self.x) - self.size, int(self.y) - self.size))
+        """Blit every particle's faded dot sprite in one blits() call."""
+        x = self.x; y = self.y
+        life = self.life; size = self.size; color = self.color
+        blit_list = self.blit_list
+        blit_list.clear()
+        for i in range(self.count):
+            r = size[i]
+            sprite = _dot_sprite(color[i], r, int(_fade_level(life[i]) * 255))
+            blit_list.append((sprite, (int(x[i]) - r, int(y[i]) - r)))
+        surface.blits(blit_list, doreturn=False)
 
 
 # ---------- Finger trail ----------
 
 class TrailDot:
     """A rainbow circle left by a finger drag."""
+    __slots__ = ("x", "y", "color", "life", "size")
+
     def __init__(self, x, y, hue):
         self.x = x
         self.y = y
@@ -188,12 +357,12 @@ class TrailDot:
         self.life -= dt * 2.0  # fade over ~0.5s
         return self.life > 0
 
-    def draw(self, surface):
-        alpha = max(0, min(255, int(self.life * 255)))
-        sz = max(1, int(self.size * self.life))
-        s = pygame.Surface((sz * 2, sz * 2), pygame.SRCALPHA)
-        pygame.draw.circle(s, (*self.color, alpha), (sz, sz), sz)
-        surface.blit(s, (int(self.x) - sz, int(self.y) - sz))
+    def blit_item(self):
+        """(sprite, position) pair for this frame's blits() batch."""
+        level = _fade_level(self.life)
+        sz = max(1, int(self.size * level))
+        sprite = _dot_sprite(self.color, sz, int(level * 255))
+        return sprite, (int(self.x) - sz, int(self.y) - sz)
 
 
 # ---------- Interactive AVA letter ----------
@@ -205,6 +374,8 @@ class AvaLetter:
         (80, 220, 80), (80, 180, 255), (160, 80, 255),
         (255, 80, 200),
     ]
+    BOUNCE_STEPS = 12  # pre-scaled glyph frames per bounce
+
 
     def __init__(self, char, base_x, base_y, phase_offset):
         self.char = char
@@ -214,21 +385,23 @@ class AvaLetter:
         self.color = WHITE
         self.scale = 1.0
         self.bounce_timer = 0.0
-        self.particles = []
-
-    def tap(self):
-        """Trigger bounce and particle burst."""
+        # Rendered glyph per color, its shadow (never changes), and the
+        # bounce ladders: pre-scaled copies for each step of the bounce
+        self._glyphs = {}
+        self._shadow = None
+        self._ladders = {}
+        self._shadow_ladder = None
+
+    def tap(self, font, particles):
+        """Trigger bounce and a particle burst into the shared pool."""
         self.bounce_timer = 0.4
         self.color = random.choice(self.RAINBOW)
-        # Spawn particles
-        for _ in range(18):
-            p_color = random.choice(self.RAINBOW)
-            self.particles.append(LetterParticle(self.base_x, self.base_y, p_color))
+        self._build_ladder(font)
+        particles.burst(self.base_x, self.base_y, self.RAINBOW)
 
     def get_rect(self, font):
         """Return approximate hit rect for this letter."""
-        surf = font.render(self.char, True, WHITE)
-        w, h = surf.get_size()
+        w, h = font.size(self.char)
         return pygame.Rect(self.base_x - w // 2 - 10, self.base_y - h // 2 - 10,
                           w + 20, h + 20)
 
@@ -245,31 +418,9 @@ class AvaLetter:
         else:
             self.scale = 1.0
 
-        # Update particles (capped)
-        self.particles = [p for p in self.particles if p.update(dt)]
-        if len(self.particles) > 60:
-            self.particles = self.particles[-60:]
-
     def draw(self, surface, font, time):
-        # Draw particles behind letter
-        for p in self.particles:
-            p.draw(surface)
-
-        # Render letter
-        text_surf = font.render(self.char, True, self.color)
-        if self.scale != 1.0:
-            w, h = text_surf.get_size()
-            new_w = int(w * self.scale)
-            new_h = int(h * self.scale)
-            text_surf = pygame.transform.smoothscale(text_surf, (new_w, new_h))
-
-        # Shadow
-        shadow_surf = font.render(self.char, True, (0, 0, 0))
-        shadow_surf.set_alpha(50)
-        if self.scale != 1.0:
-            shadow_surf = pygame.transform.smoothscale(shadow_surf,
-                (int(shadow_surf.get_width() * self.scale),
-                 int(shadow_surf.get_height() * self.scale)))
+        # Letter and shadow (pre-rendered per color and bounce step)
+        text_surf, shadow_surf = self._get_surfs(font)
         shadow_rect = shadow_surf.get_rect(
             center=(self.base_x + 3, self.base_y + self.bob_y + 4))
         surface.blit(shadow_surf, shadow_rect)
@@ -278,6 +429,48 @@ class AvaLetter:
         rect = text_surf.get_rect(center=(self.base_x, self.base_y + self.bob_y))
         surface.blit(text_surf, rect)
 
+    def _glyph(self, font):
+        """Unscaled glyph in the current color, rendered once per color."""
+        surf = self._glyphs.get(self.color)
+        if surf is None:
+            surf = self._glyphs[self.color] = font.render(self.char, True, self.color)
+        return surf
+
+    def _build_ladder(self, font):
+        """Pre-scale the glyph (and, once, its shadow) to the bounce curve
+        sampled at the middle of each of BOUNCE_STEPS steps."""
+        if self._shadow is None:
+            self._shadow = font.render(self.char, True, (0, 0, 0))
+            self._shadow.set_alpha(50)
+        if self._shadow_ladder is None:
+            w, h = self._shadow.get_size()
+            ladder = []
+            for step in range(self.BOUNCE_STEPS):
+                t = 1 - (step + 0.5) / self.BOUNCE_STEPS
+                scale = 1.0 + 0.3 * math.sin(t * math.pi)
+                size = (int(w * scale), int(h * scale))
+                ladder.append(pygame.transform.smoothscale(self._shadow, size))
+            self._shadow_ladder = ladder
+        if self.color not in self._ladders:
+            glyph = self._glyph(font)
+            self._ladders[self.color] = [
+                pygame.transform.smoothscale(glyph, shadow.get_size())
+                for shadow in self._shadow_ladder]
+
+    def _get_surfs(self, font):
+        """Return (text, shadow) surfaces for this frame of the bounce."""
+        if self.scale == 1.0:
+            if self._shadow is None:
+                self._shadow = font.render(self.char, True, (0, 0, 0))
+                self._shadow.set_alpha(50)
+            return self._glyph(font), self._shadow
+        step = min(self.BOUNCE_STEPS - 1,
+                   int((1 - self.bounce_timer / 0.4) * self.BOUNCE_STEPS))
+        if self.color not in self._ladders:
+            # Color changed mid-bounce (e.g. reset on re-entering the menu)
+            self._build_ladder(font)
+        return self._ladders[self.color][step], self._shadow_ladder[step]
+
 
 # ---------- PIN keypad overlay ----------
 
@@ -306,6 +499,9 @@ class PinOverlay:
         ]
         self.pressed_key = None
         self.pressed_timer = 0.0
+        self.dim_overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        self.dim_overlay.fill((0, 0, 0, 180))
+        self.font = get_font(36)
 
     def open(self):
         self.active = True
@@ -392,9 +588,7 @@ class PinOverlay:
             return
 
         # Dim overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self.dim_overlay, (0, 0))
 
         # PIN dots
         dot_y = self.grid_y - 70
@@ -428,11 +622,10 @@ class PinOverlay:
                 pygame.draw.rect(surface, color, rect, border_radius=16)
                 pygame.draw.rect(surface, (90, 90, 90), rect, width=1, border_radius=16)
 
-                font = get_font(36)
                 label = key
                 if key == "<":
                     label = "\u2190"
-                text = font.render(label, True, WHITE)
+                text = self.font.render(label, True, WHITE)
                 text_rect = text.get_rect(center=rect.center)
                 surface.blit(text, text_rect)
 
@@ -457,18 +650,25 @@ class MainMenuScreen:
         self.press = PressTracker(3)
 
         self.time = 0.0
-        self.pending_nav = None
+        self.pending_state = None
+        self.pending_timer = 0.0
 
         # Lava lamp blobs
         self.blobs = [LavaBlob() for _ in range(3)]
 
         # Background surface (updated every few frames for performance)
         self.bg_surface = pygame.Surface((WIDTH, HEIGHT))
+        # Low-res canvas the blobs are composed on, and the scratch layer
+        # each blob is drawn into before blending; both reused (cleared)
+        # across blobs and rebuilds instead of reallocated
+        lava_size = (WIDTH // LAVA_SCALE, HEIGHT // LAVA_SCALE)
+        self._lava_small = pygame.Surface(lava_size)
+        self._blob_layer = pygame.Surface(lava_size, pygame.SRCALPHA)
         self.bg_frame_counter = 0
         self._rebuild_gradient()
 
         # AVA letters
-        font = get_font(110)
+        font = self.letter_font = get_font(110)
         # Measure total width to center the letters
         a_w = font.size("A")[0]
         v_w = font.size("V")[0]
@@ -480,16 +680,22 @@ class MainMenuScreen:
             AvaLetter("V", start_x + a_w // 2 + 10 + v_w // 2, letter_y, math.pi * 0.66),
             AvaLetter("A", start_x + a_w // 2 + 10 + v_w + 10 + a_w // 2, letter_y, math.pi * 1.33),
         ]
+        # Tap particles for all three letters (60 each at most)
+        self.letter_particles = LetterParticles(180)
 
         # Floating shapes
-        self.shapes = [FloatingShape() for _ in range(28)]
+        self.shapes = FloatingShapes(28)
 
         # Finger trail
         self.trail = []
         self.trail_hue = 0.0
+        self._trail_blits = []  # reused for the trail blits() batch
         self.dragging = False
 
-        # Subtitle pulse
+        # "Game Box" subtitle, positioned below the AVA letters (accounting
+        # for bob); only its alpha pulses
+        self.sub_surf = get_font(28, bold=False).render("Game Box", True, (255, 255, 255))
+        self.sub_rect = self.sub_surf.get_rect(center=(WIDTH // 2, 230))
         self.subtitle_alpha = 180
 
         # Button slide-in animation
@@ -502,25 +708,30 @@ class MainMenuScreen:
         self.pin_overlay = PinOverlay()
 
     def _rebuild_gradient(self):
-        """Render the lava-lamp gradient background to a cached surface."""
+        """Render the lava-lamp gradient background to a cached surface.
+        The blobs are soft, so they are composed at 1/LAVA_SCALE size and
+        smoothscaled up to full screen."""
         # Start with a dark-ish base
-        self.bg_surface.fill((30, 20, 50))
+        small = self._lava_small
+        small.fill((30, 20, 50))
 
         # Draw each blob as a radial gradient (approximated with concentric circles)
+        temp = self._blob_layer
         for blob in self.blobs:
             color = blob.get_color()
-            temp = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+            center = (int(blob.x) // LAVA_SCALE, int(blob.y) // LAVA_SCALE)
+            temp.fill((0, 0, 0, 0))
             steps = 12
             for i in range(steps, 0, -1):
                 frac = i / steps
-                r = int(blob.radius * frac)
+                r = int(blob.radius * frac) // LAVA_SCALE
                 alpha = int(60 * (1 - frac) + 10)
                 cr = int(color[0] * frac + 30 * (1 - frac))
                 cg = int(color[1] * frac + 20 * (1 - frac))
                 cb = int(color[2] * frac + 50 * (1 - frac))
-                pygame.draw.circle(temp, (cr, cg, cb, alpha),
-                                 (int(blob.x), int(blob.y)), r)
-            self.bg_surface.blit(temp, (0, 0))
+                pygame.draw.circle(temp, (cr, cg, cb, alpha), center, r)
+            small.blit(temp, (0, 0))
+        pygame.transform.smoothscale(small, (WIDTH, HEIGHT), self.bg_surface)
 
     def _bounce_ease(self, t):
         """Attempt a bounce-out easing. t goes from 0 to 1."""
@@ -533,16 +744,19 @@ class MainMenuScreen:
 
     def on_enter(self):
         self.press = PressTracker(3)
-        self.pending_nav = None
+        self.pending_state = None
+        self.pending_timer = 0.0
         self.time = 0.0
         self.enter_timer = 0.0
         self.entered = False
         self.trail.clear()
         self.dragging = False
-        # Reset letter colors
+        # Reset letter colors and stop any bounce in progress
         for letter in self.letters:
             letter.color = WHITE
-            letter.particles.clear()
+            letter.bounce_timer = 0.0
+            letter.scale = 1.0
+        self.letter_particles.clear()
         self.secret_taps = []
         self.pin_overlay.close()
 
@@ -571,20 +785,19 @@ class MainMenuScreen:
             for i, btn in enumerate(self.buttons):
                 if btn.collidepoint(pos):
                     self.press.trigger(i)
-                    self.pending_nav = (self.states[i], 0.12)
+                    self.pending_state = self.states[i]
+                    self.pending_timer = 0.12
                     return
 
             # Check letter taps
-            font = get_font(110)
             for letter in self.letters:
-                r = letter.get_rect(font)
+                r = letter.get_rect(self.letter_font)
                 if r.collidepoint(pos):
-                    letter.tap()
+                    letter.tap(self.letter_font, self.letter_particles)
                     return
 
             # Scatter floating shapes from tap
-            for shape in self.shapes:
-                shape.scatter_from(pos[0], pos[1])
+            self.shapes.scatter_from(pos[0], pos[1])
 
         elif event.type == pygame.MOUSEBUTTONUP:
             self.dragging = False
@@ -613,26 +826,26 @@ class MainMenuScreen:
         self.enter_timer += dt
         self.press.update(dt)
 
-        # Update lava blobs and refresh gradient every 4 frames
+        # Update lava blobs and refresh gradient every few frames
         for blob in self.blobs:
             blob.update(dt)
         self.bg_frame_counter += 1
-        if self.bg_frame_counter >= 4:
+        if self.bg_frame_counter >= LAVA_REFRESH_FRAMES:
             self.bg_frame_counter = 0
             self._rebuild_gradient()
 
-        # Update AVA letters
+        # Update AVA letters and their particles
         for letter in self.letters:
             letter.update(dt, self.time)
+        self.letter_particles.update(dt)
 
         # Update floating shapes
-        for shape in self.shapes:
-            shape.update(dt, self.time)
+        self.shapes.update(dt, self.time)
 
         # Update finger trail
-        self.trail = [d for d in self.trail if d.update(dt)]
+        _advance(self.trail, dt)
         if len(self.trail) > 120:
-            self.trail = self.trail[-120:]
+            del self.trail[:-120]
 
         # Subtitle pulse
         self.subtitle_alpha = 140 + int(40 * math.sin(self.time * 2.5))
@@ -650,39 +863,32 @@ class MainMenuScreen:
             self.buttons[i].y = int(start_y + (target_y - start_y) * eased)
 
         # Navigation with delay for press animation
-        if self.pending_nav:
-            state, timer = self.pending_nav
-            timer -= dt
-            if timer <= 0:
-                self.pending_nav = None
+        if self.pending_state:
+            self.pending_timer -= dt
+            if self.pending_timer <= 0:
+                state = self.pending_state
+                self.pending_state = None
                 self.app.go_to(state)
-            else:
-                self.pending_nav = (state, timer)
 
     def draw(self, surface):
         # Lava-lamp gradient background
         surface.blit(self.bg_surface, (0, 0))
 
         # Floating shapes (behind everything interactive)
-        for shape in self.shapes:
-            shape.draw(surface, self.time)
+        self.shapes.draw(surface, self.time)
 
         # Finger trail
-        for dot in self.trail:
-            dot.draw(surface)
+        _draw_dots(surface, self.trail, self._trail_blits)
 
-        # AVA letters
-        font = get_font(110)
+        # AVA letters, particles behind them
+        self.letter_particles.draw(surface)
+        font = self.letter_font
         for letter in self.letters:
             letter.draw(surface, font, self.time)
 
         # "Game Box" subtitle
-        sub_font = get_font(28, bold=False)
-        sub_surf = sub_font.render("Game Box", True, (255, 255, 255))
-        sub_surf.set_alpha(self.subtitle_alpha)
-        # Position below the AVA letters (accounting for bob)
-        sub_rect = sub_surf.get_rect(center=(WIDTH // 2, 230))
-        surface.blit(sub_surf, sub_rect)
+        self.sub_surf.set_alpha(self.subtitle_alpha)
+        surface.blit(self.sub_surf, self.sub_rect)
 
         # Buttons
         for i in range(3):
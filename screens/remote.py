@@ -58,8 +58,19 @@ class RemoteScreen:
 
         self.press = PressTracker(len(self.buttons))
 
+        # Static background + header, rendered once and blitted each frame
+        self._bg = pygame.Surface((WIDTH, HEIGHT))
+        self._bg.fill((20, 20, 50))
+        self.back_rect = draw_header(self._bg, "REMOTE")
+
+        # Dirty-rect tracking: only buttons whose press state flipped need
+        # to be presented after the first full frame
+        self._full_redraw = True
+        self._drawn_pressed = []
+
     def on_enter(self):
         self.press = PressTracker(len(self.buttons))
+        self._full_redraw = True
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
@@ -76,9 +87,12 @@ class RemoteScreen:
     def update(self, dt):
         self.press.update(dt)
 
+    def is_animated(self):
+        """Only a press animation moves on this screen."""
+        return self.press.is_active()
+
     def draw(self, surface):
-        surface.fill((20, 20, 50))
-        self.back_rect = draw_header(surface, "REMOTE")
+        surface.blit(self._bg, (0, 0))
 
         for i, btn in enumerate(self.buttons):
             pressed = self.press.is_pressed(i)
@@ -124,3 +138,14 @@ class RemoteScreen:
                 text_surf = font.render(btn.label, True, WHITE)
                 text_rect = text_surf.get_rect(center=(cx, cy))
                 surface.blit(text_surf, text_rect)
+
+        # Report what changed since the last frame
+        pressed_now = list(self.press.pressed)
+        if self._full_redraw:
+            self._full_redraw = False
+            self._drawn_pressed = pressed_now
+            return None
+        dirty = [btn.rect.inflate(16, 24) for i, btn in enumerate(self.buttons)
+                 if pressed_now[i] != self._drawn_pressed[i]]
+        self._drawn_pressed = pressed_now
+        return dirty
@@ -22,6 +22,11 @@ SHAPE_DEFS = [
 SHAPE_SIZE = 70  # approximate radius / half-size
 SNAP_DIST = 55
 
+# 256 evenly spaced unit vectors — particle bursts pick a direction by index
+# instead of calling cos/sin per particle
+_DIR_TABLE = [(math.cos(2 * math.pi * i / 256), math.sin(2 * math.pi * i / 256))
+              for i in range(256)]
+
 
 def _star_points(cx, cy, outer_r, inner_r):
     """Return list of (x, y) for a 5-pointed star."""
@@ -81,20 +86,21 @@ def _draw_shape(surface, name, cx, cy, color, size, outline_only=False, outline_
 
 def _point_in_shape(name, px, py, cx, cy, size):
     """Simple hit test — use circle bounding for all shapes (good enough for toddler taps)."""
-    dist = math.hypot(px - cx, py - cy)
-    return dist <= size + 10  # small forgiveness margin
+    dx, dy = px - cx, py - cy
+    reach = size + 10  # small forgiveness margin
+    return dx * dx + dy * dy <= reach * reach
 
 
 class SnapParticle:
     """Small colored circle that flies outward and fades on correct placement."""
 
     def __init__(self, x, y, color):
-        angle = random.uniform(0, 2 * math.pi)
+        c, s = _DIR_TABLE[random.randrange(256)]
         speed = random.uniform(150, 400)
         self.x = x
         self.y = y
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
+        self.vx = c * speed
+        self.vy = s * speed
         self.color = color
         self.radius = random.uniform(4, 9)
         self.life = random.uniform(0.4, 0.8)
@@ -267,8 +273,9 @@ class ShapeSorterScreen:
                 self.dragged_shape = None
 
                 # Check if near correct target
-                dist = math.hypot(shape.x - shape.target_x, shape.y - shape.target_y)
-                if dist < SNAP_DIST:
+                dx = shape.x - shape.target_x
+                dy = shape.y - shape.target_y
+                if dx * dx + dy * dy < SNAP_DIST * SNAP_DIST:
                     # Snap into place
                     shape.x = shape.target_x
                     shape.y = shape.target_y
@@ -132,6 +132,10 @@ class ShowsScreen:
     def update(self, dt):
         self.press.update(dt)
 
+    def is_animated(self):
+        """Only a press animation moves on this screen."""
+        return self.press.is_active()
+
     def draw(self, surface):
         surface.fill(SKY_BLUE)
 
@@ -145,7 +149,6 @@ class ShowsScreen:
             pressed = self.press.is_pressed(i)
 
             face = draw_3d_card(surface, rect, bg_color, 12, pressed)
-            p_off = 2 if pressed else 0
 
             if i in self.images:
                 img = self.images[i]
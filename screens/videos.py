@@ -123,6 +123,10 @@ class VideosScreen:
     def update(self, dt):
         self.press.update(dt)
 
+    def is_animated(self):
+        """Only a press animation moves on this screen."""
+        return self.press.is_active()
+
     def draw(self, surface):
         surface.fill(SKY_BLUE)
 
@@ -4,7 +4,7 @@ import pygame
 import random
 import math
 from config import WIDTH, HEIGHT, WHITE, BLACK
-from ui import draw_back_button, get_font, hsv_to_rgb, ScrollToolbar
+from ui import draw_back_button, get_font, hsv_to_rgb, ScrollToolbar, make_vertical_gradient
 
 
 # ---------------------------------------------------------------------------
@@ -24,50 +24,24 @@ _BTN_H = 58
 _BTN_GAP = 6
 _BTN_START_X = 110  # after back button (80px + gap)
 
+GLOW_STEPS = 16  # firefly glow halos are cached at this many pulse levels
+
 
 # ---------------------------------------------------------------------------
 # Gradient helper (cached per scene)
 # ---------------------------------------------------------------------------
 def _make_gradient(top, bottom):
-    surf = pygame.Surface((WIDTH, HEIGHT))
-    for y in range(HEIGHT):
-        t = y / HEIGHT
-        r = int(top[0] + (bottom[0] - top[0]) * t)
-        g = int(top[1] + (bottom[1] - top[1]) * t)
-        b = int(top[2] + (bottom[2] - top[2]) * t)
-        pygame.draw.line(surf, (r, g, b), (0, y), (WIDTH, y))
-    return surf
+    return make_vertical_gradient(WIDTH, HEIGHT, top, bottom)
 
 
 def _make_dusk_gradient():
     """Three-stop gradient: deep blue -> purple -> orange horizon."""
-    surf = pygame.Surface((WIDTH, HEIGHT))
-    for y in range(HEIGHT):
-        t = y / HEIGHT
-        if t < 0.5:
-            u = t / 0.5
-            r = int(10 + (60 - 10) * u)
-            g = int(10 + (20 - 10) * u)
-            b = int(60 + (80 - 60) * u)
-        else:
-            u = (t - 0.5) / 0.5
-            r = int(60 + (180 - 60) * u)
-            g = int(20 + (100 - 20) * u)
-            b = int(80 + (40 - 80) * u)
-        pygame.draw.line(surf, (r, g, b), (0, y), (WIDTH, y))
-    return surf
+    return make_vertical_gradient(WIDTH, HEIGHT, (10, 10, 60), (60, 20, 80), (180, 100, 40))
 
 
 def _make_night_sky():
     """Dark night sky for aurora scene."""
-    surf = pygame.Surface((WIDTH, HEIGHT))
-    for y in range(HEIGHT):
-        t = y / HEIGHT
-        r = int(5 + 10 * t)
-        g = int(5 + 8 * t)
-        b = int(20 + 15 * t)
-        pygame.draw.line(surf, (r, g, b), (0, y), (WIDTH, y))
-    return surf
+    return make_vertical_gradient(WIDTH, HEIGHT, (5, 5, 20), (15, 13, 35))
 
 
 # ---------------------------------------------------------------------------
@@ -143,6 +117,10 @@ class WeatherToyScreen:
 
         # Pre-render backgrounds (lazy — built on first use)
         self._bg_cache = {}
+        # Reused per-frame surfaces (lazy)
+        self._glow_cache = {}     # (hue, pulse step) -> firefly glow halo
+        self._btn_bg_cache = {}   # (scene, w, h) -> translucent button face
+        self._aurora_surf = None  # scratch layer, cleared each frame
 
         # Aurora state
         self._aurora_ripples = []  # (x, time_created)
@@ -312,7 +290,10 @@ class WeatherToyScreen:
             for p in self.particles:
                 dx = p["x"] - tx
                 dy = p["y"] - ty
-                dist = math.sqrt(dx * dx + dy * dy) + 0.1
+                dist_sq = dx * dx + dy * dy
+                if dist_sq >= 150 * 150:
+                    continue  # out of reach, skip the sqrt
+                dist = math.sqrt(dist_sq) + 0.1
                 if dist < 150:
                     force = (150 - dist) / 150 * 300
                     p["vx"] += (dx / dist) * force
@@ -341,7 +322,10 @@ class WeatherToyScreen:
             for p in self.particles:
                 dx = tx - p["x"]
                 dy = ty - p["y"]
-                dist = math.sqrt(dx * dx + dy * dy) + 0.1
+                dist_sq = dx * dx + dy * dy
+                if dist_sq >= 200 * 200:
+                    continue  # out of reach, skip the sqrt
+                dist = math.sqrt(dist_sq) + 0.1
                 if dist < 200:
                     strength = (200 - dist) / 200 * 60
                     p["vx"] += (dx / dist) * strength
@@ -352,7 +336,10 @@ class WeatherToyScreen:
             for p in self.particles:
                 dx = p["x"] - tx
                 dy = p["y"] - ty
-                dist = math.sqrt(dx * dx + dy * dy) + 0.1
+                dist_sq = dx * dx + dy * dy
+                if dist_sq >= 160 * 160:
+                    continue  # out of reach, skip the sqrt
+                dist = math.sqrt(dist_sq) + 0.1
                 if dist < 160:
                     force = (160 - dist) / 160
                     # Swirl: perpendicular + upward
@@ -527,27 +514,38 @@ class WeatherToyScreen:
                                (int(s["x"]), int(s["y"])), r)
 
     # -- Fireflies ------------------------------------------------------
+    def _firefly_glow(self, hue, size, step):
+        """Glow halo for a firefly at pulse step 0..GLOW_STEPS (cached)."""
+        key = (int(hue), int(size * 3), step)
+        glow = self._glow_cache.get(key)
+        if glow is None:
+            pulse = step / GLOW_STEPS
+            alpha = int(40 + 215 * pulse)
+            glow_r = int(key[1] + pulse * 6)
+            glow_size = glow_r * 2 + 2
+            glow = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
+            rgb = hsv_to_rgb(key[0], 0.8, 1.0)
+            pygame.draw.circle(glow, (*rgb, alpha // 3),
+                               (glow_size // 2, glow_size // 2), glow_r)
+            pygame.draw.circle(glow, (*rgb, alpha // 2),
+                               (glow_size // 2, glow_size // 2), max(1, glow_r // 2))
+            self._glow_cache[key] = glow
+        return glow
+
     def _draw_fireflies(self, surface):
         for p in self.particles:
             pulse = (math.sin(self.time * p["pulse_speed"] + p["phase"]) + 1) * 0.5
-            alpha = int(40 + 215 * pulse)
             size = p["size"]
-            glow_r = int(size * 3 + pulse * 6)
             x = int(p["x"])
             y = int(p["y"])
 
-            # Glow halo (small SRCALPHA surface)
-            glow_size = glow_r * 2 + 2
-            glow = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
+            # Glow halo
+            glow = self._firefly_glow(p["hue"], size, int(pulse * GLOW_STEPS + 0.5))
+            half = glow.get_width() // 2
+            surface.blit(glow, (x - half, y - half))
             rgb = hsv_to_rgb(p["hue"], 0.8, 1.0)
-            pygame.draw.circle(glow, (*rgb, alpha // 3),
-                               (glow_size // 2, glow_size // 2), glow_r)
-            pygame.draw.circle(glow, (*rgb, alpha // 2),
-                               (glow_size // 2, glow_size // 2), max(1, glow_r // 2))
-            surface.blit(glow, (x - glow_size // 2, y - glow_size // 2))
 
             # Core dot
-            core_alpha = min(255, alpha)
             core_color = (
                 min(255, rgb[0] + 60),
                 min(255, rgb[1] + 60),
@@ -590,7 +588,12 @@ class WeatherToyScreen:
         band_height = (band_bottom - band_top) // num_bands
 
         # Use a SRCALPHA surface for translucent aurora
-        aurora_surf = pygame.Surface((WIDTH, band_bottom - band_top), pygame.SRCALPHA)
+        aurora_surf = self._aurora_surf
+        if aurora_surf is None:
+            aurora_surf = pygame.Surface((WIDTH, band_bottom - band_top), pygame.SRCALPHA)
+            self._aurora_surf = aurora_surf
+        else:
+            aurora_surf.fill((0, 0, 0, 0))
 
         for band_i in range(num_bands):
             base_hue = 120 + band_i * 35  # greens -> teals -> purples
@@ -666,9 +669,13 @@ class WeatherToyScreen:
                 pygame.draw.rect(surface, bright, rect, border_radius=14)
                 pygame.draw.rect(surface, WHITE, rect, width=2, border_radius=14)
             else:
-                btn_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(btn_surf, (*color, 160), (0, 0, rect.width, rect.height),
-                                 border_radius=14)
+                key = (i, rect.width, rect.height)
+                btn_surf = self._btn_bg_cache.get(key)
+                if btn_surf is None:
+                    btn_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+                    pygame.draw.rect(btn_surf, (*color, 160), (0, 0, rect.width, rect.height),
+                                     border_radius=14)
+                    self._btn_bg_cache[key] = btn_surf
                 surface.blit(btn_surf, rect.topleft)
 
             # Icon centered above label
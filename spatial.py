@@ -0,0 +1,63 @@
+# spatial.py — Uniform-grid spatial hash for broad-phase neighbour queries
+
+
+class UniformGrid:
+    """Buckets point items by the grid cell they fall in.
+
+    A radius query only visits the cells the query square overlaps, so
+    lookups cost O(items nearby) instead of O(all items). The caller does
+    the exact distance test on what comes back.
+
+    Usage:
+        grid = UniformGrid(cell_size=120)
+        grid.insert(item, x, y)
+        for other in grid.query_radius(x, y, r): ...
+        grid.remove(item, x, y)   # same x, y it was inserted with
+    """
+
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> list of items
+
+    def cell_of(self, x, y):
+        """Return the (cell_x, cell_y) key for a point."""
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def insert(self, item, x, y):
+        """Add item at (x, y). Returns its cell."""
+        cell = self.cell_of(x, y)
+        self.cells.setdefault(cell, []).append(item)
+        return cell
+
+    def remove(self, item, x, y):
+        """Remove item previously inserted at (x, y).
+        Returns True if that left its cell empty."""
+        cell = self.cell_of(x, y)
+        bucket = self.cells.get(cell)
+        if not bucket or item not in bucket:
+            return False
+        # Bucket order doesn't matter: swap-and-pop instead of shifting
+        i = bucket.index(item)
+        bucket[i] = bucket[-1]
+        bucket.pop()
+        if bucket:
+            return False
+        del self.cells[cell]
+        return True
+
+    def query_radius(self, x, y, r):
+        """Return every item in the cells overlapped by the square (x, y) ± r."""
+        cs = self.cell_size
+        x0, x1 = int((x - r) // cs), int((x + r) // cs)
+        y0, y1 = int((y - r) // cs), int((y + r) // cs)
+        cells = self.cells
+        found = []
+        for gx in range(x0, x1 + 1):
+            for gy in range(y0, y1 + 1):
+                bucket = cells.get((gx, gy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def clear(self):
+        self.cells.clear()
@@ -0,0 +1,73 @@
+# tests/test_main_menu.py — Main menu regression tests (SDL dummy driver)
+
+import os
+import sys
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from app import App
+from config import WIDTH, HEIGHT, MAIN_MENU, GAMES_MENU, WHITE
+from screens.main_menu import MainMenuScreen
+
+
+class _Idle:
+    """Stand-in screen for the state the menu navigates to."""
+    def handle_event(self, event):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def draw(self, surface):
+        pass
+
+
+def setUpModule():
+    # Initialized once: ui.get_font caches Font objects across screens,
+    # and those must not outlive a pygame.quit()
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGHT))
+
+
+def tearDownModule():
+    pygame.quit()
+
+
+class ReenterWhileBouncingTest(unittest.TestCase):
+    def setUp(self):
+        self.surface = pygame.display.get_surface()
+        self.app = App()
+        self.menu = MainMenuScreen(self.app)
+        self.app.register(MAIN_MENU, self.menu)
+        self.app.register(GAMES_MENU, _Idle())
+
+    def test_go_back_mid_bounce_draws(self):
+        """Leaving and re-entering the menu during a letter bounce must
+        not look up a bounce ladder for the reset (white) color."""
+        letter = self.menu.letters[0]
+        letter.tap(self.menu.letter_font, self.menu.letter_particles)
+        self.app.update(1 / 60)
+        self.app.go_to(GAMES_MENU)
+        self.app.go_back()
+        self.assertEqual(letter.color, WHITE)
+        self.assertEqual(letter.bounce_timer, 0.0)
+        self.app.update(1 / 60)
+        self.menu.draw(self.surface)
+
+    def test_color_change_mid_bounce_draws(self):
+        """A color with no ladder yet, set during a bounce, gets one."""
+        letter = self.menu.letters[1]
+        letter.tap(self.menu.letter_font, self.menu.letter_particles)
+        self.menu.update(1 / 60)
+        letter.color = (1, 2, 3)
+        self.menu.draw(self.surface)
+        self.assertIn((1, 2, 3), letter._ladders)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -99,6 +99,23 @@ def brighten(color, amount=40):
     return tuple(min(255, c + amount) for c in color[:3])
 
 
+def make_vertical_gradient(width, height, *colors):
+    """Return a width x height Surface fading top to bottom through colors
+    (evenly spaced stops). Only one pixel column is computed; scale()
+    repeats it across the width."""
+    column = pygame.Surface((1, height))
+    segments = len(colors) - 1
+    for y in range(height):
+        pos = y / height * segments
+        k = min(int(pos), segments - 1)
+        u = pos - k
+        a, b = colors[k], colors[k + 1]
+        column.set_at((0, y), (int(a[0] + (b[0] - a[0]) * u),
+                               int(a[1] + (b[1] - a[1]) * u),
+                               int(a[2] + (b[2] - a[2]) * u)))
+    return pygame.transform.scale(column, (width, height))
+
+
 def draw_shadow(surface, rect, radius=20, offset=4, alpha=60):
     """Draw a soft drop shadow beneath a rect."""
     shadow = pygame.Surface((rect.width + offset * 2, rect.height + offset * 2), pygame.SRCALPHA)
@@ -253,6 +270,10 @@ class PressTracker:
     def is_pressed(self, index):
         return self.pressed[index]
 
+    def is_active(self):
+        """True while any press animation is still running."""
+        return any(self.pressed)
+
     def get_scale(self, index):
         """Return scale factor (1.0 normal, dips to ~0.95 on press, bounces back)."""
         t = self.press_timers[index]
@@ -381,7 +402,8 @@ class ScrollToolbar:
 
 def draw_battery_indicator(surface, pct, charging=None):
     """Draw a small battery icon with percentage in the bottom-right corner.
-    pct: 0-100 or None (shows '?'). Semi-transparent overlay."""
+    pct: 0-100 or None (shows '?'). Semi-transparent overlay.
+    Returns the rect that was drawn."""
     margin = 10
     batt_w, batt_h = 34, 18
     tip_w, tip_h = 3, 8
@@ -422,11 +444,12 @@ def draw_battery_indicator(surface, pct, charging=None):
     text_rect = text.get_rect(midright=(ox - 4, oy + batt_h // 2))
     overlay.blit(text, text_rect)
 
-    surface.blit(overlay, (x - 50, y - 4))
+    return surface.blit(overlay, (x - 50, y - 4))
 
 
 def draw_wifi_indicator(surface, connected):
-    """Draw a small WiFi icon in the bottom-left corner. Green if connected, red if not."""
+    """Draw a small WiFi icon in the bottom-left corner. Green if connected, red if not.
+    Returns the rect that was drawn."""
     margin = 12
     x = margin
     y = 720 - margin - 22
@@ -454,4 +477,4 @@ def draw_wifi_indicator(surface, connected):
     # Center dot
     pygame.draw.circle(overlay, (*color[:3], color[3]), (cx, cy), 3)
 
-    surface.blit(overlay, (x, y))
+    return surface.blit(overlay, (x, y))